@@ -78,6 +78,8 @@ class Transpiler {
             [ /\.indexBy\s/g, '.index_by'],
             [ /\.sortBy\s/g, '.sort_by'],
             [ /\.filterBy\s/g, '.filter_by'],
+            [ /\.reconcileCachedOrders\s/g, '.reconcile_cached_orders'],
+            [ /\.selectCachedOrders\s/g, '.select_cached_orders'],
             [ /\.groupBy\s/g, '.group_by'],
             [ /\.findMarket\s/g, '.find_market'],
             [ /\.findSymbol\s/g, '.find_symbol'],
@@ -116,6 +118,7 @@ class Transpiler {
             [ /\.appendInactiveMarkets\s/g, '.append_inactive_markets'],
             [ /\.fetchCategories\s/g, '.fetch_categories'],
             [ /\.calculateFee\s/g, '.calculate_fee'],
+            [ /\.calculateRateLimiterCost\s/g, '.calculate_rate_limiter_cost'],
             [ /\.editLimitBuyOrder\s/g, '.edit_limit_buy_order'],
             [ /\.editLimitSellOrder\s/g, '.edit_limit_sell_order'],
             [ /\.editLimitOrder\s/g, '.edit_limit_order'],
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+
+# measures how long it takes to construct exchange instances
+# the first instance of each class defines the api methods and camelcase aliases
+# all subsequent instances of the same class reuse them
+
+number = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+ids = sys.argv[2:] if len(sys.argv) > 2 else ccxt.exchanges
+
+first = 0
+rest = 0
+
+for id in ids:
+    exchange_class = getattr(ccxt, id)
+    try:
+        start = time.time()
+        exchange_class()
+        first += time.time() - start
+        start = time.time()
+        for i in range(0, number):
+            exchange_class()
+        rest += time.time() - start
+    except ccxt.NotSupported as e:  # missing optional dependencies like web3
+        print(id, type(e).__name__, str(e))
+
+print('{} exchanges'.format(len(ids)))
+print('first instance:      {:.3f} ms per exchange'.format(first * 1000 / len(ids)))
+print('subsequent instance: {:.3f} ms per exchange'.format(rest * 1000 / len(ids) / number))
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import time
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(root + '/python')
+
+import ccxt  # noqa: E402
+from cryptography.hazmat.backends import default_backend  # noqa: E402
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import rsa  # noqa: E402
+
+# measures the latency of the signing methods with cold and warm caches of parsed keys
+# cold is the latency of parsing the secret on every request, before the keys were cached
+
+number = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+Exchange = ccxt.Exchange
+request = 'symbol=BTCUSDT&side=BUY&type=LIMIT&quantity=1&price=10000&timestamp=1600000000000'
+pem = rsa.generate_private_key(65537, 2048, default_backend()).private_bytes(
+    serialization.Encoding.PEM,
+    serialization.PrivateFormat.TraditionalOpenSSL,
+    serialization.NoEncryption())
+privateKey = '1a' * 32
+
+signers = [
+    ('hmac', lambda: Exchange.hmac(Exchange.encode(request), b'secret')),
+    ('jwt HS256', lambda: Exchange.jwt({'nonce': 1}, b'secret')),
+    ('rsa', lambda: Exchange.rsa(request, pem)),
+    ('ecdsa p256', lambda: Exchange.ecdsa(request, privateKey, 'p256', 'sha256')),
+    ('ecdsa secp256k1', lambda: Exchange.ecdsa(request, privateKey, 'secp256k1', 'sha256')),
+]
+
+for name, sign in signers:
+    cold = 0
+    for i in range(0, number):
+        Exchange.signing_keys.clear()
+        Exchange.jwt_headers.clear()
+        start = time.time()
+        sign()
+        cold += time.time() - start
+    start = time.time()
+    for i in range(0, number):
+        sign()
+    warm = time.time() - start
+    print('{:16} cold: {:9.3f} ms  warm: {:9.3f} ms'.format(name, cold * 1000 / number, warm * 1000 / number))
@@ -255,6 +255,9 @@ module.exports = class Exchange {
         this.minFundingAddressLength = 1 // used in checkAddress
         this.substituteCommonCurrencyCodes = true  // reserved
 
+        this.tokenBuckets = undefined // separate rate limiter settings per api type, { 'sapi': { ... }}
+        this.apiCosts     = {} // 'api METHOD path' → weight, filled by defineRestApi
+
         // do not delete this line, it is needed for users to be able to define their own fetchImplementation
         this.fetchImplementation = defaultFetch
 
@@ -384,6 +387,11 @@ module.exports = class Exchange {
 
         this.throttle = throttle (this.tokenBucket)
 
+        // api types listed in tokenBuckets are throttled independently from the rest
+        this.throttles = {}
+        for (const type of Object.keys (this.tokenBuckets || {}))
+            this.throttles[type] = throttle (this.extend (this.tokenBucket, this.tokenBuckets[type]))
+
         this.executeRestRequest = (url, method = 'GET', headers = undefined, body = undefined) => {
 
             // fetchImplementation cannot be called on this. in browsers:
@@ -448,12 +456,16 @@ module.exports = class Exchange {
         for (const type of Object.keys (api)) {
             for (const httpMethod of Object.keys (api[type])) {
 
-                let paths = api[type][httpMethod]
+                // either a list of paths or a dictionary of { path: weight }
+                let weights = api[type][httpMethod]
+                let paths = Array.isArray (weights) ? weights : Object.keys (weights)
                 for (let i = 0; i < paths.length; i++) {
                     let path = paths[i].trim ()
                     let splitPath = path.split (/[^a-zA-Z0-9]/)
 
                     let uppercaseMethod  = httpMethod.toUpperCase ()
+                    if (!Array.isArray (weights))
+                        this.apiCosts[type + ' ' + uppercaseMethod + ' ' + path] = weights[paths[i]]
                     let lowercaseMethod  = httpMethod.toLowerCase ()
                     let camelcaseMethod  = this.capitalize (lowercaseMethod)
                     let camelcaseSuffix  = splitPath.map (this.capitalize).join ('')
@@ -483,6 +495,11 @@ module.exports = class Exchange {
         }
     }
 
+    calculateRateLimiterCost (api, method, path, params) {
+        // the weight of an endpoint, override it for weights that depend on params
+        return this.apiCosts[api + ' ' + method + ' ' + path]
+    }
+
     fetch (url, method = 'GET', headers = undefined, body = undefined) {
 
         if (isNode && this.userAgent) {
@@ -517,8 +534,10 @@ module.exports = class Exchange {
 
     async fetch2 (path, type = 'public', method = 'GET', params = {}, headers = undefined, body = undefined) {
 
-        if (this.enableRateLimit)
-            await this.throttle ()
+        if (this.enableRateLimit) {
+            const cost = this.calculateRateLimiterCost (type, method, path, params)
+            await ((type in this.throttles) ? this.throttles[type] : this.throttle) (cost)
+        }
 
         const request = this.sign (path, type, method, params, headers, body)
         return this.fetch (request.url, request.method, request.headers, request.body)
@@ -793,6 +812,40 @@ module.exports = class Exchange {
         return this.orders
     }
 
+    reconcileCachedOrders (openOrders, symbol = undefined) {
+        // stores a fresh list of the open orders of a symbol or of all symbols, the cached open orders absent
+        // from it were closed or canceled externally (unnoticed by "us"), returns the cached orders of the symbol
+        const openOrderIds = {}
+        for (let i = 0; i < openOrders.length; i++) {
+            const id = openOrders[i]['id']
+            this.orders[id] = (id in this.orders) ? this.extend (this.orders[id], openOrders[i]) : openOrders[i]
+            openOrderIds[id] = true
+        }
+        const cachedOrders = this.selectCachedOrders (symbol, 'open')
+        for (let i = 0; i < cachedOrders.length; i++) {
+            const order = cachedOrders[i]
+            if (!(order['id'] in openOrderIds)) {
+                const filled = order['amount']
+                const price = order['price']
+                this.orders[order['id']] = this.extend (order, {
+                    'status': 'closed',
+                    'cost': ((filled !== undefined) && (price !== undefined)) ? filled * price : undefined,
+                    'filled': filled,
+                    'remaining': 0.0,
+                })
+            }
+        }
+        return this.selectCachedOrders (symbol)
+    }
+
+    selectCachedOrders (symbol = undefined, status = undefined) {
+        return Object
+            .values (this.orders)
+            .filter (order =>
+                ((symbol === undefined) || (order.symbol === symbol)) &&
+                ((status === undefined) || (order.status === status)))
+    }
+
     fetchOrder (id, symbol = undefined, params = {}) {
         throw new NotSupported (this.id + ' fetchOrder not supported yet');
     }
@@ -841,6 +894,11 @@ module.exports = class Exchange {
         return new Promise ((resolve, reject) => resolve (Object.values (this.markets)))
     }
 
+    gather (promises) {
+        // awaits independent requests concurrently, each of them still waits for its turn in the rate limiter
+        return Promise.all (promises)
+    }
+
     async fetchOrderStatus (id, symbol = undefined, params = {}) {
         const order = await this.fetchOrder (id, symbol, params);
         return order['status'];
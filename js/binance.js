@@ -14,7 +14,7 @@ module.exports = class binance extends Exchange {
             'id': 'binance',
             'name': 'Binance',
             'countries': [ 'JP', 'MT' ], // Japan, Malta
-            'rateLimit': 500,
+            'rateLimit': 50, // 1200 request weight per minute, the weights of the endpoints are declared in the api below
             'certified': true,
             // new metainfo interface
             'has': {
@@ -52,6 +52,10 @@ module.exports = class binance extends Exchange {
                 '1w': '1w',
                 '1M': '1M',
             },
+            // the largest pages of the paginated fetch methods, used by the history iterators of the python version
+            'historyPageLimits': {
+                'fetchOHLCV': 500,
+            },
             'urls': {
                 'logo': 'https://user-images.githubusercontent.com/1294454/29604020-d5483cdc-87ee-11e7-94c7-d1a8d9169293.jpg',
                 'api': {
@@ -81,28 +85,28 @@ module.exports = class binance extends Exchange {
                 },
                 // the API structure below will need 3-layer apidefs
                 'sapi': {
-                    'get': [
+                    'get': {
                         // these endpoints require this.apiKey
-                        'margin/asset',
-                        'margin/pair',
-                        'margin/allAssets',
-                        'margin/allPairs',
-                        'margin/priceIndex',
+                        'margin/asset': 1,
+                        'margin/pair': 1,
+                        'margin/allAssets': 1,
+                        'margin/allPairs': 1,
+                        'margin/priceIndex': 1,
                         // these endpoints require this.apiKey + this.secret
-                        'asset/assetDividend',
-                        'margin/loan',
-                        'margin/repay',
-                        'margin/account',
-                        'margin/transfer',
-                        'margin/interestHistory',
-                        'margin/forceLiquidationRec',
-                        'margin/order',
-                        'margin/openOrders',
-                        'margin/allOrders',
-                        'margin/myTrades',
-                        'margin/maxBorrowable',
-                        'margin/maxTransferable',
-                    ],
+                        'asset/assetDividend': 1,
+                        'margin/loan': 1,
+                        'margin/repay': 1,
+                        'margin/account': 5,
+                        'margin/transfer': 1,
+                        'margin/interestHistory': 1,
+                        'margin/forceLiquidationRec': 1,
+                        'margin/order': 1,
+                        'margin/openOrders': 10,
+                        'margin/allOrders': 5,
+                        'margin/myTrades': 5,
+                        'margin/maxBorrowable': 5,
+                        'margin/maxTransferable': 5,
+                    },
                     'post': [
                         'asset/dust',
                         'margin/transfer',
@@ -140,15 +144,15 @@ module.exports = class binance extends Exchange {
                     ],
                 },
                 'fapiPrivate': {
-                    'get': [
-                        'allOrders',
-                        'openOrders',
-                        'order',
-                        'account',
-                        'balance',
-                        'positionRisk',
-                        'userTrades',
-                    ],
+                    'get': {
+                        'allOrders': 5,
+                        'openOrders': 1,
+                        'order': 1,
+                        'account': 5,
+                        'balance': 5,
+                        'positionRisk': 5,
+                        'userTrades': 5,
+                    },
                     'post': [
                         'order',
                     ],
@@ -163,34 +167,34 @@ module.exports = class binance extends Exchange {
                     ],
                 },
                 'public': {
-                    'get': [
-                        'ping',
-                        'time',
-                        'depth',
-                        'trades',
-                        'aggTrades',
-                        'historicalTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
-                    ],
+                    'get': {
+                        'ping': 1,
+                        'time': 1,
+                        'depth': 1, // from 1 to 50 depending on the limit, see calculateRateLimiterCost
+                        'trades': 1,
+                        'aggTrades': 1,
+                        'historicalTrades': 5,
+                        'klines': 1,
+                        'ticker/24hr': 1, // 40 without a symbol
+                        'ticker/price': 1, // 2 without a symbol
+                        'ticker/bookTicker': 1, // 2 without a symbol
+                        'exchangeInfo': 1,
+                    },
                     'put': [ 'userDataStream' ],
                     'post': [ 'userDataStream' ],
                     'delete': [ 'userDataStream' ],
                 },
                 'private': {
-                    'get': [
-                        'allOrderList', // oco
-                        'openOrderList', // oco
-                        'orderList', // oco
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
-                    ],
+                    'get': {
+                        'allOrderList': 10, // oco
+                        'openOrderList': 2, // oco
+                        'orderList': 1, // oco
+                        'order': 1,
+                        'openOrders': 1, // 40 without a symbol
+                        'allOrders': 5,
+                        'account': 5,
+                        'myTrades': 5,
+                    },
                     'post': [
                         'order/oco',
                         'order',
@@ -202,6 +206,14 @@ module.exports = class binance extends Exchange {
                     ],
                 },
             },
+            // the sapi, wapi and futures endpoints have limits of their own
+            'tokenBuckets': {
+                'sapi': {},
+                'wapi': {},
+                'fapiPrivate': {
+                    'refillRate': 0.04, // 2400 request weight per minute
+                },
+            },
             'fees': {
                 'trading': {
                     'tierBased': false,
@@ -1299,6 +1311,28 @@ module.exports = class binance extends Exchange {
         };
     }
 
+    calculateRateLimiterCost (api, method, path, params) {
+        const symbol = this.safeString (params, 'symbol');
+        if ((api === 'public') && (path === 'depth')) {
+            const limit = this.safeInteger (params, 'limit', 100);
+            if (limit <= 100) {
+                return 1;
+            } else if (limit <= 500) {
+                return 5;
+            } else if (limit <= 1000) {
+                return 10;
+            }
+            return 50;
+        } else if (symbol === undefined) {
+            if ((path === 'ticker/24hr') || (path === 'openOrders')) {
+                return 40;
+            } else if ((path === 'ticker/price') || (path === 'ticker/bookTicker')) {
+                return 2;
+            }
+        }
+        return super.calculateRateLimiterCost (api, method, path, params);
+    }
+
     sign (path, api = 'public', method = 'GET', params = {}, headers = undefined, body = undefined) {
         let url = this.urls['api'][api];
         url += '/' + path;
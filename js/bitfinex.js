@@ -52,6 +52,10 @@ module.exports = class bitfinex extends Exchange {
                 '2w': '14D',
                 '1M': '1M',
             },
+            // the largest pages of the paginated fetch methods, used by the history iterators of the python version
+            'historyPageLimits': {
+                'fetchOHLCV': 5000,
+            },
             'urls': {
                 'logo': 'https://user-images.githubusercontent.com/1294454/27766244-e328a50c-5ed2-11e7-947b-041416579bb3.jpg',
                 'api': {
@@ -41,6 +41,10 @@ module.exports = class coinbasepro extends Exchange {
                 '6h': 21600,
                 '1d': 86400,
             },
+            // the largest pages of the paginated fetch methods, used by the history iterators of the python version
+            'historyPageLimits': {
+                'fetchMyTrades': 100, // since is ignored, the history is a single page
+            },
             'urls': {
                 'test': 'https://api-public.sandbox.pro.coinbase.com',
                 'logo': 'https://user-images.githubusercontent.com/1294454/41764625-63b7ffde-760a-11e8-996d-a6328fa9347a.jpg',
@@ -407,10 +407,14 @@ module.exports = class exx extends Exchange {
         //
         const code = this.safeString (response, 'code');
         const message = this.safeString (response, 'message');
-        const feedback = this.id + ' ' + this.json (response);
         if (code === '100') {
             return;
         }
+        const result = this.safeValue (response, 'result');
+        if ((code === undefined) && ((result === undefined) || result)) {
+            return; // no error, successful responses are not serialized
+        }
+        const feedback = this.id + ' ' + this.json (response);
         if (code !== undefined) {
             const exceptions = this.exceptions;
             if (code in exceptions) {
@@ -423,7 +427,6 @@ module.exports = class exx extends Exchange {
                 throw new ExchangeError (feedback);
             }
         }
-        const result = this.safeValue (response, 'result');
         if (result !== undefined) {
             if (!result) {
                 if (message === '服务端忙碌') {
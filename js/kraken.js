@@ -1396,19 +1396,25 @@ module.exports = class kraken extends Exchange {
             throw new ExchangeNotAvailable (this.id + ' ' + code.toString () + ' ' + reason);
         }
         // todo: rewrite this for "broad" exceptions matching
-        if (body.indexOf ('Invalid order') >= 0) {
+        let errors = body;
+        if ((code < 400) && (response !== undefined) && (typeof response !== 'string')) {
+            // only the error list of a successful json reply is scanned
+            const messages = this.safeValue (response, 'error', []);
+            errors = Array.isArray (messages) ? messages.join (' ') : messages.toString ();
+        }
+        if (errors.indexOf ('Invalid order') >= 0) {
             throw new InvalidOrder (this.id + ' ' + body);
         }
-        if (body.indexOf ('Invalid nonce') >= 0) {
+        if (errors.indexOf ('Invalid nonce') >= 0) {
             throw new InvalidNonce (this.id + ' ' + body);
         }
-        if (body.indexOf ('Insufficient funds') >= 0) {
+        if (errors.indexOf ('Insufficient funds') >= 0) {
             throw new InsufficientFunds (this.id + ' ' + body);
         }
-        if (body.indexOf ('Cancel pending') >= 0) {
+        if (errors.indexOf ('Cancel pending') >= 0) {
             throw new CancelPending (this.id + ' ' + body);
         }
-        if (body.indexOf ('Invalid arguments:volume') >= 0) {
+        if (errors.indexOf ('Invalid arguments:volume') >= 0) {
             throw new InvalidOrder (this.id + ' ' + body);
         }
         if (body[0] === '{') {
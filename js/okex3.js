@@ -480,10 +480,14 @@ module.exports = class okex3 extends Exchange {
 
     async fetchMarkets (params = {}) {
         const types = this.safeValue (this.options, 'fetchMarkets');
-        let result = [];
+        const requests = [];
         for (let i = 0; i < types.length; i++) {
-            const markets = await this.fetchMarketsByType (types[i], params);
-            result = this.arrayConcat (result, markets);
+            requests.push (this.fetchMarketsByType (types[i], params));
+        }
+        const responses = await this.gather (requests);
+        let result = [];
+        for (let i = 0; i < responses.length; i++) {
+            result = this.arrayConcat (result, responses[i]);
         }
         return result;
     }
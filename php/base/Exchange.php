@@ -815,6 +815,7 @@ class Exchange {
             'defaultCost' => 1.0,
             'maxCapacity' => 1000,
         );
+        $this->apiCosts = array(); // 'api METHOD path' => weight, filled by define_rest_api
 
         $this->curlopt_interface = null;
         $this->timeout = 10000; // in milliseconds
@@ -1036,11 +1037,16 @@ class Exchange {
 
     public function define_rest_api($api, $method_name, $options = array()) {
         foreach ($api as $type => $methods) {
-            foreach ($methods as $http_method => $paths) {
+            foreach ($methods as $http_method => $weights) {
+                // either a list of paths or an associative array of path => weight
+                $paths = static::is_associative($weights) ? array_keys($weights) : $weights;
                 foreach ($paths as $path) {
                     $splitPath = mb_split('[^a-zA-Z0-9]', $path);
 
                     $uppercaseMethod = mb_strtoupper($http_method);
+                    if (static::is_associative($weights)) {
+                        $this->apiCosts[$type . ' ' . $uppercaseMethod . ' ' . $path] = $weights[$path];
+                    }
                     $lowercaseMethod = mb_strtolower($http_method);
                     $camelcaseMethod = static::capitalize($lowercaseMethod);
                     $camelcaseSuffix = implode(array_map(get_called_class() . '::capitalize', $splitPath));
@@ -1156,20 +1162,36 @@ class Exchange {
     }
 
     // this method is experimental
-    public function throttle() {
+    public function throttle($cost = null) {
+        // a request of weight $cost waits $cost times the rateLimit after the previous one
+        $cost = isset($cost) ? $cost : $this->tokenBucket['defaultCost'];
         $now = $this->milliseconds();
         $elapsed = $now - $this->lastRestRequestTimestamp;
-        if ($elapsed < $this->rateLimit) {
-            $delay = $this->rateLimit - $elapsed;
+        $interval = $this->rateLimit * $cost;
+        if ($elapsed < $interval) {
+            $delay = $interval - $elapsed;
             usleep((int) ($delay * 1000.0));
         }
     }
 
+    public function calculateRateLimiterCost($api, $method, $path, $params) {
+        return $this->calculate_rate_limiter_cost($api, $method, $path, $params);
+    }
+
+    public function calculate_rate_limiter_cost($api, $method, $path, $params) {
+        // the weight of an endpoint, override it for weights that depend on params
+        $key = $api . ' ' . $method . ' ' . $path;
+        return isset($this->apiCosts[$key]) ? $this->apiCosts[$key] : null;
+    }
+
     public function sign($path, $api = 'public', $method = 'GET', $params = array(), $headers = null, $body = null) {
         throw new NotSupported($this->id . ' sign() not supported yet');
     }
 
     public function fetch2($path, $api = 'public', $method = 'GET', $params = array(), $headers = null, $body = null) {
+        if ($this->enableRateLimit) {
+            $this->throttle($this->calculate_rate_limiter_cost($api, $method, $path, $params));
+        }
         $request = $this->sign($path, $api, $method, $params, $headers, $body);
         return $this->fetch($request['url'], $request['method'], $request['headers'], $request['body']);
     }
@@ -1223,10 +1245,6 @@ class Exchange {
     }
 
     public function fetch($url, $method = 'GET', $headers = null, $body = null) {
-        if ($this->enableRateLimit) {
-            $this->throttle();
-        }
-
         $headers = array_merge($this->headers, $headers ? $headers : array());
 
         if (strlen($this->proxy)) {
@@ -1929,6 +1947,44 @@ class Exchange {
         return $this->purge_cached_orders($before);
     }
 
+    public function reconcile_cached_orders($open_orders, $symbol = null) {
+        // stores a fresh list of the open orders of a symbol or of all symbols, the cached open orders absent
+        // from it were closed or canceled externally (unnoticed by "us"), returns the cached orders of the symbol
+        $open_order_ids = array();
+        foreach ($open_orders as $order) {
+            $id = $order['id'];
+            $this->orders[$id] = array_key_exists($id, $this->orders) ? $this->extend($this->orders[$id], $order) : $order;
+            $open_order_ids[$id] = true;
+        }
+        foreach ($this->select_cached_orders($symbol, 'open') as $order) {
+            if (!array_key_exists($order['id'], $open_order_ids)) {
+                $filled = $order['amount'];
+                $price = $order['price'];
+                $this->orders[$order['id']] = $this->extend($order, array(
+                    'status' => 'closed',
+                    'cost' => (isset($filled) && isset($price)) ? $filled * $price : null,
+                    'filled' => $filled,
+                    'remaining' => 0.0,
+                ));
+            }
+        }
+        return $this->select_cached_orders($symbol);
+    }
+
+    public function reconcileCachedOrders($open_orders, $symbol = null) {
+        return $this->reconcile_cached_orders($open_orders, $symbol);
+    }
+
+    public function select_cached_orders($symbol = null, $status = null) {
+        return array_values(array_filter($this->orders, function ($order) use ($symbol, $status) {
+            return (!isset($symbol) || ($order['symbol'] === $symbol)) && (!isset($status) || ($order['status'] === $status));
+        }));
+    }
+
+    public function selectCachedOrders($symbol = null, $status = null) {
+        return $this->select_cached_orders($symbol, $status);
+    }
+
     public function fetch_order($id, $symbol = null, $params = array()) {
         throw new NotSupported($this->id . ' fetch_order() not supported yet');
     }
@@ -2021,6 +2077,11 @@ class Exchange {
         return $this->fetch_markets($params);
     }
 
+    public function gather($results) {
+        // the counterpart of the async gather, the requests have already been made one by one
+        return array_values($results);
+    }
+
     public function fetch_currencies($params = array()) {
         // markets are returned as a list
         // currencies are returned as a dict
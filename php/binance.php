@@ -14,7 +14,7 @@ class binance extends Exchange {
             'id' => 'binance',
             'name' => 'Binance',
             'countries' => array ( 'JP', 'MT' ), // Japan, Malta
-            'rateLimit' => 500,
+            'rateLimit' => 50, // 1200 request weight per minute, the weights of the endpoints are declared in the api below
             'certified' => true,
             // new metainfo interface
             'has' => array (
@@ -52,6 +52,10 @@ class binance extends Exchange {
                 '1w' => '1w',
                 '1M' => '1M',
             ),
+            // the largest pages of the paginated fetch methods, used by the history iterators of the python version
+            'historyPageLimits' => array (
+                'fetchOHLCV' => 500,
+            ),
             'urls' => array (
                 'logo' => 'https://user-images.githubusercontent.com/1294454/29604020-d5483cdc-87ee-11e7-94c7-d1a8d9169293.jpg',
                 'api' => array (
@@ -83,25 +87,25 @@ class binance extends Exchange {
                 'sapi' => array (
                     'get' => array (
                         // these endpoints require $this->apiKey
-                        'margin/asset',
-                        'margin/pair',
-                        'margin/allAssets',
-                        'margin/allPairs',
-                        'margin/priceIndex',
+                        'margin/asset' => 1,
+                        'margin/pair' => 1,
+                        'margin/allAssets' => 1,
+                        'margin/allPairs' => 1,
+                        'margin/priceIndex' => 1,
                         // these endpoints require $this->apiKey . $this->secret
-                        'asset/assetDividend',
-                        'margin/loan',
-                        'margin/repay',
-                        'margin/account',
-                        'margin/transfer',
-                        'margin/interestHistory',
-                        'margin/forceLiquidationRec',
-                        'margin/order',
-                        'margin/openOrders',
-                        'margin/allOrders',
-                        'margin/myTrades',
-                        'margin/maxBorrowable',
-                        'margin/maxTransferable',
+                        'asset/assetDividend' => 1,
+                        'margin/loan' => 1,
+                        'margin/repay' => 1,
+                        'margin/account' => 5,
+                        'margin/transfer' => 1,
+                        'margin/interestHistory' => 1,
+                        'margin/forceLiquidationRec' => 1,
+                        'margin/order' => 1,
+                        'margin/openOrders' => 10,
+                        'margin/allOrders' => 5,
+                        'margin/myTrades' => 5,
+                        'margin/maxBorrowable' => 5,
+                        'margin/maxTransferable' => 5,
                     ),
                     'post' => array (
                         'asset/dust',
@@ -141,13 +145,13 @@ class binance extends Exchange {
                 ),
                 'fapiPrivate' => array (
                     'get' => array (
-                        'allOrders',
-                        'openOrders',
-                        'order',
-                        'account',
-                        'balance',
-                        'positionRisk',
-                        'userTrades',
+                        'allOrders' => 5,
+                        'openOrders' => 1,
+                        'order' => 1,
+                        'account' => 5,
+                        'balance' => 5,
+                        'positionRisk' => 5,
+                        'userTrades' => 5,
                     ),
                     'post' => array (
                         'order',
@@ -164,17 +168,17 @@ class binance extends Exchange {
                 ),
                 'public' => array (
                     'get' => array (
-                        'ping',
-                        'time',
-                        'depth',
-                        'trades',
-                        'aggTrades',
-                        'historicalTrades',
-                        'klines',
-                        'ticker/24hr',
-                        'ticker/price',
-                        'ticker/bookTicker',
-                        'exchangeInfo',
+                        'ping' => 1,
+                        'time' => 1,
+                        'depth' => 1, // from 1 to 50 depending on the limit, see calculateRateLimiterCost
+                        'trades' => 1,
+                        'aggTrades' => 1,
+                        'historicalTrades' => 5,
+                        'klines' => 1,
+                        'ticker/24hr' => 1, // 40 without a symbol
+                        'ticker/price' => 1, // 2 without a symbol
+                        'ticker/bookTicker' => 1, // 2 without a symbol
+                        'exchangeInfo' => 1,
                     ),
                     'put' => array ( 'userDataStream' ),
                     'post' => array ( 'userDataStream' ),
@@ -182,14 +186,14 @@ class binance extends Exchange {
                 ),
                 'private' => array (
                     'get' => array (
-                        'allOrderList', // oco
-                        'openOrderList', // oco
-                        'orderList', // oco
-                        'order',
-                        'openOrders',
-                        'allOrders',
-                        'account',
-                        'myTrades',
+                        'allOrderList' => 10, // oco
+                        'openOrderList' => 2, // oco
+                        'orderList' => 1, // oco
+                        'order' => 1,
+                        'openOrders' => 1, // 40 without a symbol
+                        'allOrders' => 5,
+                        'account' => 5,
+                        'myTrades' => 5,
                     ),
                     'post' => array (
                         'order/oco',
@@ -202,6 +206,14 @@ class binance extends Exchange {
                     ),
                 ),
             ),
+            // the sapi, wapi and futures endpoints have limits of their own
+            'tokenBuckets' => array (
+                'sapi' => array(),
+                'wapi' => array(),
+                'fapiPrivate' => array (
+                    'refillRate' => 0.04, // 2400 request weight per minute
+                ),
+            ),
             'fees' => array (
                 'trading' => array (
                     'tierBased' => false,
@@ -1299,6 +1311,28 @@ class binance extends Exchange {
         );
     }
 
+    public function calculate_rate_limiter_cost ($api, $method, $path, $params) {
+        $symbol = $this->safe_string($params, 'symbol');
+        if (($api === 'public') && ($path === 'depth')) {
+            $limit = $this->safe_integer($params, 'limit', 100);
+            if ($limit <= 100) {
+                return 1;
+            } else if ($limit <= 500) {
+                return 5;
+            } else if ($limit <= 1000) {
+                return 10;
+            }
+            return 50;
+        } else if ($symbol === null) {
+            if (($path === 'ticker/24hr') || ($path === 'openOrders')) {
+                return 40;
+            } else if (($path === 'ticker/price') || ($path === 'ticker/bookTicker')) {
+                return 2;
+            }
+        }
+        return parent::calculate_rate_limiter_cost($api, $method, $path, $params);
+    }
+
     public function sign ($path, $api = 'public', $method = 'GET', $params = array (), $headers = null, $body = null) {
         $url = $this->urls['api'][$api];
         $url .= '/' . $path;
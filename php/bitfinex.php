@@ -52,6 +52,10 @@ class bitfinex extends Exchange {
                 '2w' => '14D',
                 '1M' => '1M',
             ),
+            // the largest pages of the paginated fetch methods, used by the history iterators of the python version
+            'historyPageLimits' => array (
+                'fetchOHLCV' => 5000,
+            ),
             'urls' => array (
                 'logo' => 'https://user-images.githubusercontent.com/1294454/27766244-e328a50c-5ed2-11e7-947b-041416579bb3.jpg',
                 'api' => array (
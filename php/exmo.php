@@ -928,47 +928,6 @@ class exmo extends Exchange {
         return $this->parse_trades($trades, $market, $since, $limit);
     }
 
-    public function update_cached_orders ($openOrders, $symbol) {
-        // update local cache with open orders
-        for ($j = 0; $j < count ($openOrders); $j++) {
-            $id = $openOrders[$j]['id'];
-            $this->orders[$id] = $openOrders[$j];
-        }
-        $openOrdersIndexedById = $this->index_by($openOrders, 'id');
-        $cachedOrderIds = is_array($this->orders) ? array_keys($this->orders) : array();
-        for ($k = 0; $k < count ($cachedOrderIds); $k++) {
-            // match each cached $order to an $order in the open orders array
-            // possible reasons why a cached $order may be missing in the open orders array:
-            // - $order was closed or canceled -> update cache
-            // - $symbol mismatch (e.g. cached BTC/USDT, fetched ETH/USDT) -> skip
-            $id = $cachedOrderIds[$k];
-            $order = $this->orders[$id];
-            if (!(is_array($openOrdersIndexedById) && array_key_exists($id, $openOrdersIndexedById))) {
-                // cached $order is not in open orders array
-                // if we fetched orders by $symbol and it doesn't match the cached $order -> won't update the cached $order
-                if ($symbol !== null && $symbol !== $order['symbol']) {
-                    continue;
-                }
-                // $order is cached but not present in the list of open orders -> mark the cached $order as closed
-                if ($order['status'] === 'open') {
-                    $order = array_merge ($order, array (
-                        'status' => 'closed', // likewise it might have been canceled externally (unnoticed by "us")
-                        'cost' => null,
-                        'filled' => $order['amount'],
-                        'remaining' => 0.0,
-                    ));
-                    if ($order['cost'] === null) {
-                        if ($order['filled'] !== null) {
-                            $order['cost'] = $order['filled'] * $order['price'];
-                        }
-                    }
-                    $this->orders[$id] = $order;
-                }
-            }
-        }
-        return $this->to_array($this->orders);
-    }
-
     public function fetch_orders ($symbol = null, $since = null, $limit = null, $params = array ()) {
         $this->load_markets();
         $response = $this->privatePostUserOpenOrders ($params);
@@ -983,20 +942,20 @@ class exmo extends Exchange {
             $parsedOrders = $this->parse_orders($response[$marketId], $market);
             $orders = $this->array_concat($orders, $parsedOrders);
         }
-        $this->update_cached_orders ($orders, $symbol);
-        return $this->filter_by_symbol_since_limit($this->to_array($this->orders), $symbol, $since, $limit);
+        $cachedOrders = $this->reconcile_cached_orders($orders, $symbol);
+        return $this->filter_by_since_limit($cachedOrders, $since, $limit);
     }
 
     public function fetch_open_orders ($symbol = null, $since = null, $limit = null, $params = array ()) {
         $this->fetch_orders($symbol, $since, $limit, $params);
-        $orders = $this->filter_by($this->orders, 'status', 'open');
-        return $this->filter_by_symbol_since_limit($orders, $symbol, $since, $limit);
+        $orders = $this->select_cached_orders($symbol, 'open');
+        return $this->filter_by_since_limit($orders, $since, $limit);
     }
 
     public function fetch_closed_orders ($symbol = null, $since = null, $limit = null, $params = array ()) {
         $this->fetch_orders($symbol, $since, $limit, $params);
-        $orders = $this->filter_by($this->orders, 'status', 'closed');
-        return $this->filter_by_symbol_since_limit($orders, $symbol, $since, $limit);
+        $orders = $this->select_cached_orders($symbol, 'closed');
+        return $this->filter_by_since_limit($orders, $since, $limit);
     }
 
     public function parse_order ($order, $market = null) {
@@ -408,10 +408,14 @@ class exx extends Exchange {
         //
         $code = $this->safe_string($response, 'code');
         $message = $this->safe_string($response, 'message');
-        $feedback = $this->id . ' ' . $this->json ($response);
         if ($code === '100') {
             return;
         }
+        $result = $this->safe_value($response, 'result');
+        if (($code === null) && (($result === null) || $result)) {
+            return; // no error, successful responses are not serialized
+        }
+        $feedback = $this->id . ' ' . $this->json ($response);
         if ($code !== null) {
             $exceptions = $this->exceptions;
             if (is_array($exceptions) && array_key_exists($code, $exceptions)) {
@@ -424,7 +428,6 @@ class exx extends Exchange {
                 throw new ExchangeError($feedback);
             }
         }
-        $result = $this->safe_value($response, 'result');
         if ($result !== null) {
             if (!$result) {
                 if ($message === '服务端忙碌') {
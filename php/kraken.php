@@ -1396,19 +1396,25 @@ class kraken extends Exchange {
             throw new ExchangeNotAvailable($this->id . ' ' . (string) $code . ' ' . $reason);
         }
         // todo => rewrite this for "broad" exceptions matching
-        if (mb_strpos($body, 'Invalid order') !== false) {
+        $errors = $body;
+        if (($code < 400) && ($response !== null) && (gettype ($response) !== 'string')) {
+            // only the error list of a successful json reply is scanned
+            $messages = $this->safe_value($response, 'error', array());
+            $errors = gettype ($messages) === 'array' && count (array_filter (array_keys ($messages), 'is_string')) == 0 ? implode(' ', $messages) : (string) $messages;
+        }
+        if (mb_strpos($errors, 'Invalid order') !== false) {
             throw new InvalidOrder($this->id . ' ' . $body);
         }
-        if (mb_strpos($body, 'Invalid nonce') !== false) {
+        if (mb_strpos($errors, 'Invalid nonce') !== false) {
             throw new InvalidNonce($this->id . ' ' . $body);
         }
-        if (mb_strpos($body, 'Insufficient funds') !== false) {
+        if (mb_strpos($errors, 'Insufficient funds') !== false) {
             throw new InsufficientFunds($this->id . ' ' . $body);
         }
-        if (mb_strpos($body, 'Cancel pending') !== false) {
+        if (mb_strpos($errors, 'Cancel pending') !== false) {
             throw new CancelPending($this->id . ' ' . $body);
         }
-        if (mb_strpos($body, 'Invalid arguments:volume') !== false) {
+        if (mb_strpos($errors, 'Invalid arguments:volume') !== false) {
             throw new InvalidOrder($this->id . ' ' . $body);
         }
         if ($body[0] === '{') {
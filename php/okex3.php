@@ -481,10 +481,14 @@ class okex3 extends Exchange {
 
     public function fetch_markets ($params = array ()) {
         $types = $this->safe_value($this->options, 'fetchMarkets');
-        $result = array();
+        $requests = array();
         for ($i = 0; $i < count ($types); $i++) {
-            $markets = $this->fetch_markets_by_type ($types[$i], $params);
-            $result = $this->array_concat($result, $markets);
+            $requests[] = $this->fetch_markets_by_type ($types[$i], $params);
+        }
+        $responses = $this->gather ($requests);
+        $result = array();
+        for ($i = 0; $i < count ($responses); $i++) {
+            $result = $this->array_concat($result, $responses[$i]);
         }
         return $result;
     }
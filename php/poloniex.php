@@ -825,42 +825,8 @@ class poloniex extends Exchange {
                 $openOrders = $this->parse_open_orders ($orders, $m, $openOrders);
             }
         }
-        for ($j = 0; $j < count ($openOrders); $j++) {
-            $this->orders[$openOrders[$j]['id']] = $openOrders[$j];
-        }
-        $openOrdersIndexedById = $this->index_by($openOrders, 'id');
-        $cachedOrderIds = is_array($this->orders) ? array_keys($this->orders) : array();
-        $result = array();
-        for ($k = 0; $k < count ($cachedOrderIds); $k++) {
-            $id = $cachedOrderIds[$k];
-            if (is_array($openOrdersIndexedById) && array_key_exists($id, $openOrdersIndexedById)) {
-                $this->orders[$id] = array_merge ($this->orders[$id], $openOrdersIndexedById[$id]);
-            } else {
-                $order = $this->orders[$id];
-                if ($order['status'] === 'open') {
-                    $order = array_merge ($order, array (
-                        'status' => 'closed',
-                        'cost' => null,
-                        'filled' => $order['amount'],
-                        'remaining' => 0.0,
-                    ));
-                    if ($order['cost'] === null) {
-                        if ($order['filled'] !== null) {
-                            $order['cost'] = $order['filled'] * $order['price'];
-                        }
-                    }
-                    $this->orders[$id] = $order;
-                }
-            }
-            $order = $this->orders[$id];
-            if ($market !== null) {
-                if ($order['symbol'] === $symbol) {
-                    $result[] = $order;
-                }
-            } else {
-                $result[] = $order;
-            }
-        }
+        // the cached open $orders absent from the list of open $orders are marked as closed
+        $result = $this->reconcile_cached_orders($openOrders, $symbol);
         return $this->filter_by_since_limit($result, $since, $limit);
     }
 
@@ -7,7 +7,9 @@ __version__ = '1.19.90'
 # -----------------------------------------------------------------------------
 
 import asyncio
+import collections
 import concurrent
+import json
 import socket
 import time
 import math
@@ -43,8 +45,74 @@ __all__ = [
 # -----------------------------------------------------------------------------
 
 
+class AsyncHistoryIterator(object):
+    """Iterates the history returned by an async fetch method page by page, requesting the next page
+    while the entries of the current one are consumed, see Exchange.iter_history
+
+    A consumer that stops before the end of the history (break out of async for) leaves the request
+    of the next page pending, await aclose() to cancel it, or use the iterator as a context manager:
+
+        async with exchange.iter_trades(symbol, since) as trades:
+            async for trade in trades:
+                ...
+    """
+
+    def __init__(self, exchange, method, args, since=None, until=None, limit=None, params={}, step=0):
+        self.exchange = exchange
+        self.fetch = getattr(exchange, method)
+        self.args = args
+        self.limit = limit if limit else exchange.historyPageLimits.get(method)
+        self.params = params
+        self.step = step
+        self.state = exchange.init_history_state(since, until)
+        self.entries = collections.deque()
+        self.next_page = None
+
+    def request_next_page(self):
+        arguments = self.args + [self.state['since'], self.limit, self.params]
+        self.next_page = self.exchange.asyncio_loop.create_task(self.fetch(*arguments))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.entries:
+            if self.state['done']:
+                raise StopAsyncIteration
+            if self.next_page is None:
+                self.request_next_page()
+            page = await self.next_page
+            self.next_page = None
+            self.entries.extend(self.exchange.next_history_page(page, self.state, self.step))
+            if not self.state['done']:
+                self.request_next_page()
+        return self.entries.popleft()
+
+    async def aclose(self):
+        """Cancels the request of the next page when the iteration is stopped before the end"""
+        self.state['done'] = True
+        next_page, self.next_page = self.next_page, None
+        if next_page is not None:
+            next_page.cancel()
+            await asyncio.gather(next_page, return_exceptions=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self.aclose()
+
+    def __del__(self):
+        # an iterator dropped without aclose() does not leave its last request running
+        if self.next_page is not None and not self.next_page.done():
+            self.next_page.cancel()
+
+
 class Exchange(BaseExchange):
 
+    ssl_contexts = {}  # cafile → ssl context, shared process-wide
+    connectors = {}  # (loop, ssl, options) → TCPConnector, see aiohttp_shared_connector
+
     def __init__(self, config={}):
         if 'asyncio_loop' in config:
             self.asyncio_loop = config['asyncio_loop']
@@ -53,13 +121,19 @@ class Exchange(BaseExchange):
         self.verify = config.get('verify', self.verify)
         self.own_session = 'session' not in config
         self.cafile = config.get('cafile', certifi.where())
+        self._in_flight = {}  # key → the task awaited by concurrent callers, see single_flight
         super(Exchange, self).__init__(config)
-        self.init_rest_rate_limiter()
 
     def init_rest_rate_limiter(self):
         self.throttle = throttle(self.extend({
             'loop': self.asyncio_loop,
         }, self.tokenBucket))
+        # api types listed in tokenBuckets are throttled independently from the rest
+        self.throttles = {}
+        for api_type, bucket in (self.tokenBuckets or {}).items():
+            self.throttles[api_type] = throttle(self.extend({
+                'loop': self.asyncio_loop,
+            }, self.tokenBucket, bucket))
 
     def __del__(self):
         if self.session is not None:
@@ -75,13 +149,51 @@ class Exchange(BaseExchange):
 
     def open(self):
         if self.own_session and self.session is None:
-            # Create our SSL context object with our CA cert file
-            context = ssl.create_default_context(cafile=self.cafile) if self.verify else self.verify
-            # Pass this SSL context to aiohttp and create a TCPConnector
-            connector = aiohttp.TCPConnector(ssl=context, loop=self.asyncio_loop)
-            self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
+            if self.aiohttp_shared_connector:
+                # the connector pools connections per host and outlives the session
+                connector = self.shared_connector()
+                self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, connector_owner=False, trust_env=self.aiohttp_trust_env)
+            else:
+                connector = aiohttp.TCPConnector(ssl=self.ssl_context(), loop=self.asyncio_loop, **self.aiohttp_connector_options)
+                self.session = aiohttp.ClientSession(loop=self.asyncio_loop, connector=connector, trust_env=self.aiohttp_trust_env)
+
+    def ssl_context(self):
+        if not self.verify:
+            return self.verify
+        # building a context from the CA cert file is expensive, reuse it
+        if self.cafile not in Exchange.ssl_contexts:
+            Exchange.ssl_contexts[self.cafile] = ssl.create_default_context(cafile=self.cafile)
+        return Exchange.ssl_contexts[self.cafile]
+
+    def shared_connector(self):
+        # the options may hold lists or dicts, the key uses their canonical json, objects compare by repr
+        options = json.dumps(self.aiohttp_connector_options, sort_keys=True, default=repr)
+        key = (self.asyncio_loop, self.cafile if self.verify else False, options)
+        connector = Exchange.connectors.get(key)
+        if connector is None or connector.closed:
+            connector = aiohttp.TCPConnector(ssl=self.ssl_context(), loop=self.asyncio_loop, **self.aiohttp_connector_options)
+            Exchange.connectors[key] = connector
+        return connector
+
+    @staticmethod
+    async def close_shared_connectors():
+        """Closes the connection pools shared by aiohttp_shared_connector instances"""
+        connectors = list(Exchange.connectors.values())
+        Exchange.connectors.clear()
+        for connector in connectors:
+            await connector.close()
 
     async def close(self):
+        # the background reload of the markets runs in a task of single_flight shielded from
+        # its caller, the calls in flight are cancelled along with it and awaited to completion
+        tasks = list(self._in_flight.values())
+        if self._markets_cache_refresh:
+            tasks.append(self._markets_cache_refresh)
+            self._markets_cache_refresh = None
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
         if self.session is not None:
             if self.own_session:
                 await self.session.close()
@@ -110,7 +222,8 @@ class Exchange(BaseExchange):
     async def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
         """A better wrapper over request for deferred signing"""
         if self.enableRateLimit:
-            await self.throttle()
+            cost = self.calculate_rate_limiter_cost(api, method, path, params)
+            await self.throttles.get(api, self.throttle)(cost)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         return await self.fetch(request['url'], request['method'], request['headers'], request['body'])
@@ -175,35 +288,80 @@ class Exchange(BaseExchange):
             return http_response
         return response.content
 
+    async def single_flight(self, key, method, *args):
+        """Calls method once for concurrent callers with the same key, they all await its result"""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = self.asyncio_loop.create_task(method(*args))
+            self._in_flight[key] = future
+
+            def forget(done):
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+
+            future.add_done_callback(forget)
+        # a cancelled caller does not cancel the call awaited by the others
+        return await asyncio.shield(future)
+
+    def single_flight_key(self, name, params):
+        # calls with different params do not share a result
+        return name + json.dumps(params, sort_keys=True, default=repr)
+
     async def load_markets(self, reload=False, params={}):
         if not reload:
             if self.markets:
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+        # a reload does not join a load that may return the markets cached on disk
+        key = self.single_flight_key('reload_markets', params) if reload else 'load_markets'
+        return await self.single_flight(key, self.load_markets_helper, reload, params)
+
+    async def load_markets_helper(self, reload=False, params={}):
+        if not reload:
+            if self.markets:  # loaded while this call was waiting
+                return self.markets
+            cache = self.read_markets_cache()
+            if cache:
+                if self.markets_cache_is_stale(cache) and not self._markets_cache_refresh:
+                    self._markets_cache_refresh = self.asyncio_loop.create_task(self.refresh_markets_cache(params))
+                return self.set_markets(cache['markets'], cache['currencies'])
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = await self.fetch_currencies()
         markets = await self.fetch_markets(params)
+        self.write_markets_cache(markets, currencies)
         return self.set_markets(markets, currencies)
 
+    async def refresh_markets_cache(self, params={}):
+        try:
+            await self.load_markets(True, params)
+        except Exception as e:
+            self.logger.warning('%s failed to reload the cached markets: %s', self.id, e)
+        finally:
+            self._markets_cache_refresh = None
+
+    async def gather(self, coroutines):
+        """Awaits independent requests concurrently, each of them still waits for its turn in the rate limiter"""
+        return await asyncio.gather(*coroutines)
+
     async def fetch_fees(self):
-        trading = {}
-        funding = {}
+        requests = {}
         if self.has['fetchTradingFees']:
-            trading = await self.fetch_trading_fees()
+            requests['trading'] = self.fetch_trading_fees()
         if self.has['fetchFundingFees']:
-            funding = await self.fetch_funding_fees()
-        return {
-            'trading': trading,
-            'funding': funding,
-        }
+            requests['funding'] = self.fetch_funding_fees()
+        responses = await self.gather(list(requests.values()))
+        return self.extend({
+            'trading': {},
+            'funding': {},
+        }, dict(zip(requests.keys(), responses)))
 
     async def load_fees(self, reload=False):
         if not reload:
             if self.loaded_fees != Exchange.loaded_fees:
                 return self.loaded_fees
-        self.loaded_fees = self.deep_extend(self.loaded_fees, await self.fetch_fees())
+        self.loaded_fees = self.deep_extend(self.loaded_fees, await self.single_flight('fetch_fees', self.fetch_fees))
         return self.loaded_fees
 
     async def fetch_markets(self, params={}):
@@ -262,6 +420,11 @@ class Exchange(BaseExchange):
     async def fetchOHLCV(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         return await self.fetch_ohlcv(symbol, timeframe, since, limit, params)
 
+    def iter_history(self, method, args, since=None, until=None, limit=None, params={}, step=0):
+        """Returns an async iterator over the history returned by a fetch method, use it with async for,
+        and close it with aclose() or async with when the iteration stops before the end"""
+        return AsyncHistoryIterator(self, method, args, since, until, limit, params, step)
+
     async def fetch_full_tickers(self, symbols=None, params={}):
         return await self.fetch_tickers(symbols, params)
 
@@ -282,7 +445,7 @@ class Exchange(BaseExchange):
     async def load_trading_limits(self, symbols=None, reload=False, params={}):
         if self.has['fetchTradingLimits']:
             if reload or not('limitsLoaded' in list(self.options.keys())):
-                response = await self.fetch_trading_limits(symbols)
+                response = await self.single_flight('fetch_trading_limits' + str(symbols), self.fetch_trading_limits, symbols)
                 for i in range(0, len(symbols)):
                     symbol = symbols[i]
                     self.markets[symbol] = self.deep_extend(self.markets[symbol], response[symbol])
@@ -291,12 +454,12 @@ class Exchange(BaseExchange):
 
     async def load_accounts(self, reload=False, params={}):
         if reload:
-            self.accounts = await self.fetch_accounts(params)
+            self.accounts = await self.single_flight(self.single_flight_key('fetch_accounts', params), self.fetch_accounts, params)
         else:
             if self.accounts:
                 return self.accounts
             else:
-                self.accounts = await self.fetch_accounts(params)
+                self.accounts = await self.single_flight(self.single_flight_key('fetch_accounts', params), self.fetch_accounts, params)
         self.accountsById = self.index_by(self.accounts, 'id')
         return self.accounts
 
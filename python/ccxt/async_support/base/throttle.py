@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
-from asyncio import Queue, sleep, Future, ensure_future, get_event_loop
-from time import time
+from asyncio import get_event_loop
+from collections import deque
 
 __all__ = [
     'throttle',
@@ -11,40 +11,53 @@ __all__ = [
 def throttle(config=None):
 
     cfg = {
-        'lastTimestamp': time(),
+        'lastTimestamp': None,
         'numTokens': 0,
         'running': False,
-        'queue': Queue(),
-        'loop': get_event_loop(),
-        'delay': 0.001,
+        'queue': deque(),
+        'loop': None,
+        'delay': 0.001,  # the shortest sleep in seconds, guards against busy-waiting on coarse clocks
         'refillRate': 0.001,
         'defaultCost': 1.000,
         'capacity': 1.000,
     }
 
-    cfg.update(config)
-
-    async def run():
-        if not cfg['running']:
+    cfg.update(config or {})
+
+    if cfg['loop'] is None:
+        cfg['loop'] = get_event_loop()
+
+    if cfg['lastTimestamp'] is None:
+        cfg['lastTimestamp'] = cfg['loop'].time()
+
+    def refill():
+        now = cfg['loop'].time()
+        elapsed = now - cfg['lastTimestamp']
+        cfg['lastTimestamp'] = now
+        cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+
+    def run():
+        cfg['running'] = False
+        refill()
+        queue = cfg['queue']
+        # release as many waiters as the bucket can afford in one pass
+        while queue and cfg['numTokens'] > 0:
+            cost, future = queue.popleft()
+            if future.done():  # cancelled while waiting, it does not consume tokens
+                continue
+            cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+            future.set_result(None)
+        if queue:
+            # wake up once, exactly when the bucket is refilled above zero
+            delay = -cfg['numTokens'] / (cfg['refillRate'] * 1000)
             cfg['running'] = True
-            while not cfg['queue'].empty():
-                now = time()
-                elapsed = (now - cfg['lastTimestamp'])
-                cfg['lastTimestamp'] = now
-                cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
-                if cfg['numTokens'] > 0:
-                    if not cfg['queue'].empty():
-                        cost, future = cfg['queue'].get_nowait()
-                        cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
-                        if not future.done():
-                            future.set_result(None)
-                await sleep(cfg['delay'])
-            cfg['running'] = False
+            cfg['loop'].call_later(max(delay, cfg['delay']), run)
 
     def throttle(cost=None):
-        future = Future()
-        cfg['queue'].put_nowait((cost, future))
-        ensure_future(run())
+        future = cfg['loop'].create_future()
+        cfg['queue'].append((cost, future))
+        if not cfg['running']:
+            run()
         return future
 
     return throttle
@@ -383,9 +383,12 @@ class exx(Exchange):
         #
         code = self.safe_string(response, 'code')
         message = self.safe_string(response, 'message')
-        feedback = self.id + ' ' + self.json(response)
         if code == '100':
             return
+        result = self.safe_value(response, 'result')
+        if (code is None) and ((result is None) or result):
+            return  # no error, successful responses are not serialized
+        feedback = self.id + ' ' + self.json(response)
         if code is not None:
             exceptions = self.exceptions
             if code in exceptions:
@@ -396,7 +399,6 @@ class exx(Exchange):
                 return
             else:
                 raise ExchangeError(feedback)
-        result = self.safe_value(response, 'result')
         if result is not None:
             if not result:
                 if message == u'服务端忙碌':
@@ -2,6 +2,7 @@ import decimal
 import numbers
 import itertools
 import re
+import threading
 
 __all__ = [
     'TRUNCATE',
@@ -14,6 +15,7 @@ __all__ = [
     'NO_PADDING',
     'PAD_WITH_ZERO',
     'decimal_to_precision',
+    'precision_formatter',
 ]
 
 
@@ -158,6 +160,109 @@ def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=D
             return precise
 
 
+def pad(precise, precision, counting_mode, padding_mode):
+    # the padding of decimal_to_precision for the DECIMAL_PLACES counting mode
+    if padding_mode == NO_PADDING:
+        return precise.rstrip('0').rstrip('.') if '.' in precise else precise
+    if '.' in precise:
+        before, after = precise.split('.')
+        return before + '.' + after.ljust(precision, '0')
+    if precision > 0:
+        return precise + '.' + precision * '0'
+    return precise
+
+
+contexts = threading.local()
+
+
+def get_context():
+    # the settings of decimal_to_precision in a context of each thread, the global one is left as it is
+    context = getattr(contexts, 'context', None)
+    if context is None:
+        context = decimal.getcontext().copy()
+        context.traps[decimal.Underflow] = True
+        context.rounding = decimal.ROUND_HALF_UP
+        contexts.context = context
+    return context
+
+
+def precision_formatter(rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    """Returns a function that formats a number like decimal_to_precision with the rest of the arguments
+
+    The arguments are validated and the quantum of the precision is computed once, the function is
+    specialized for the DECIMAL_PLACES and TICK_SIZE counting modes and calls decimal_to_precision otherwise.
+    """
+    assert precision is not None
+    if counting_mode == TICK_SIZE:
+        assert(isinstance(precision, float) or isinstance(precision, numbers.Integral))
+    else:
+        assert(isinstance(precision, numbers.Integral))
+    assert rounding_mode in [TRUNCATE, ROUND]
+    assert counting_mode in [DECIMAL_PLACES, SIGNIFICANT_DIGITS, TICK_SIZE]
+    assert padding_mode in [NO_PADDING, PAD_WITH_ZERO]
+
+    if counting_mode == SIGNIFICANT_DIGITS or precision < 0:
+        return lambda n: decimal_to_precision(n, rounding_mode, precision, counting_mode, padding_mode)
+
+    Decimal = decimal.Decimal
+
+    if counting_mode == TICK_SIZE:
+        tick = Decimal(str(precision))
+        half = precision / 2
+        parts = re.sub(r'0+$', '', '{:f}'.format(tick)).split('.')
+        if len(parts) > 1:
+            new_precision = len(parts[1])
+        else:
+            match = re.search(r'0+$', parts[0])
+            new_precision = 0 if match is None else - len(match.group(0))
+        formatter = precision_formatter(ROUND, new_precision, DECIMAL_PLACES, padding_mode)
+
+        def format_tick_size(n):
+            context = get_context()
+            dec = Decimal(str(n))
+            missing = context.remainder(dec, tick)
+            if missing != 0:
+                if rounding_mode == ROUND:
+                    if dec > 0:
+                        if missing >= half:
+                            dec = context.add(context.subtract(dec, missing), tick)
+                        else:
+                            dec = context.subtract(dec, missing)
+                    else:
+                        if missing >= half:
+                            dec = context.subtract(dec, missing)
+                        else:
+                            dec = context.subtract(context.subtract(dec, missing), tick)
+                else:
+                    dec = context.subtract(dec, missing)
+            return formatter('{:f}'.format(dec))
+
+        return format_tick_size
+
+    precision = min(get_context().prec - 2, precision)
+
+    if rounding_mode == ROUND:
+        quantum = get_context().power(Decimal('10'), -precision)
+
+        def format_round(n):
+            precise = '{:f}'.format(get_context().quantize(Decimal(str(n)), quantum))
+            if precise == '-0':
+                precise = precise[1:]
+            return pad(precise, precision, counting_mode, padding_mode)
+
+        return format_round
+
+    def format_truncate(n):
+        string = '{:f}'.format(Decimal(str(n)))
+        before, after = string.split('.') if '.' in string else (string, '')
+        precise = before + '.' + after[:precision]
+        if precise == '-0.' or precise == '-0':
+            precise = precise[1:]
+        return pad(precise.rstrip('.'), precision, counting_mode, padding_mode)
+
+    return format_truncate
+
+
 def number_to_string(x):
     # avoids scientific notation for too large and too small numbers
     d = decimal.Decimal(str(x))
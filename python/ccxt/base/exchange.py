@@ -24,19 +24,21 @@ from ccxt.base.errors import BadSymbol
 from ccxt.base.decimal_to_precision import decimal_to_precision
 from ccxt.base.decimal_to_precision import DECIMAL_PLACES, TRUNCATE, ROUND, ROUND_UP, ROUND_DOWN
 from ccxt.base.decimal_to_precision import number_to_string
+from ccxt.base.decimal_to_precision import precision_formatter
 
 # -----------------------------------------------------------------------------
 
-# rsa jwt signing
-from cryptography.hazmat import backends
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.serialization import load_pem_private_key
+from ccxt.base.throttle import throttle
+from ccxt.base.order_cache import OrderCache
+from ccxt.base.ohlcv import OHLCVBuilder
+from ccxt.base.ohlcv import OHLCVColumns
+from ccxt.base.ohlcv import Timeframe
+from ccxt.base.ohlcv import resample_ohlcv
 
 # -----------------------------------------------------------------------------
 
-# ecdsa signing
-from ccxt.static_dependencies import ecdsa
+# rsa jwt signing (cryptography) and ecdsa signing (ccxt.static_dependencies.ecdsa)
+# are slow to import, they are imported on first use in Exchange.rsa and Exchange.ecdsa
 
 # -----------------------------------------------------------------------------
 
@@ -57,18 +59,23 @@ from email.utils import parsedate
 import functools
 import gzip
 import hashlib
+import heapq
 import hmac
 import io
+import itertools
 import json
 import math
 from numbers import Number
+import os
 import re
 from requests import Session
+from requests.adapters import HTTPAdapter
 from requests.utils import default_user_agent
 from requests.exceptions import HTTPError, Timeout, TooManyRedirects, RequestException
-# import socket
+import socket
 from ssl import SSLError
 # import sys
+import threading
 import time
 import uuid
 import zlib
@@ -94,12 +101,68 @@ except ImportError:
     import urllib as _urlencode          # Python 2
 
 # -----------------------------------------------------------------------------
-# web3/0x imports
+# optional json decoders, see Exchange.json_decoder
+
+json_decoders = {
+    'json': json.loads,
+}
+
+try:
+    import orjson
+    json_decoders['orjson'] = orjson.loads
+except ImportError:
+    pass
+
+try:
+    import ujson
+    json_decoders['ujson'] = ujson.loads
+except ImportError:
+    pass
 
 try:
-    from web3 import Web3, HTTPProvider
+    import simdjson
+    json_decoders['simdjson'] = simdjson.loads
 except ImportError:
-    Web3 = HTTPProvider = None  # web3/0x not supported in Python 2
+    pass
+
+# -----------------------------------------------------------------------------
+# web3/0x imports, deferred until web3 is needed
+
+Web3 = HTTPProvider = None
+web3_imported = False
+
+
+def import_web3():
+    global Web3, HTTPProvider, web3_imported
+    if not web3_imported:
+        web3_imported = True
+        try:
+            from web3 import Web3, HTTPProvider
+        except ImportError:
+            pass  # web3/0x not supported in Python 2
+    return Web3
+
+# -----------------------------------------------------------------------------
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """An HTTPAdapter that applies socket options to the pooled connections"""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['socket_options']
+
+    default_socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def __init__(self, socket_options=None, **kwargs):
+        # must be set before the base constructor calls init_poolmanager
+        self.socket_options = self.default_socket_options if socket_options is None else socket_options
+        super(KeepAliveHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        return super(KeepAliveHTTPAdapter, self).init_poolmanager(*args, **kwargs)
 
 # -----------------------------------------------------------------------------
 
@@ -113,12 +176,23 @@ class Exchange(object):
     # rate limiter settings
     enableRateLimit = False
     rateLimit = 2000  # milliseconds = seconds * 1000
+    tokenBuckets = None  # separate rate limiter settings per api type, {'sapi': {...}}
+    apiCosts = {}  # (api, method, path) → weight, filled by define_rest_api
     timeout = 10000   # milliseconds = seconds * 1000
     asyncio_loop = None
     aiohttp_proxy = None
     aiohttp_trust_env = False
+    aiohttp_shared_connector = False  # share one connection pool between all async instances on the same loop
+    aiohttp_connector_options = {}  # TCPConnector settings: limit, limit_per_host, keepalive_timeout, ttl_dns_cache
     session = None  # Session () by default
+    requests_adapter_options = {}  # HTTPAdapter settings: pool_connections, pool_maxsize, pool_block, max_retries, socket_options
     verify = True  # SSL verification
+    # the number of parsed signing keys and hmac states kept by all instances of the process, 0 disables the cache,
+    # the signing methods are static, set it on the class: ccxt.Exchange.signing_keys_limit = 1000
+    signing_keys_limit = 64
+    markets_cache_dir = None  # a directory to cache the loaded markets in, shared by processes and restarts
+    markets_cache_ttl = 3600000  # milliseconds, stale markets are served while they are reloaded in the background
+    _markets_cache_refresh = None  # the background reload of stale cached markets
     logger = None  # logging.getLogger(__name__) by default
     userAgent = None
     userAgents = {
@@ -209,10 +283,13 @@ class Exchange(object):
     headers = None
     balance = None
     orderbooks = None
-    orders = None
+    orders = None  # an OrderCache of the orders seen by this instance
+    orders_cache_limit = 10000  # the number of cached orders, open orders are never evicted
+    orders_cache_max_age = None  # milliseconds, orders that are not open expire from the cache
     trades = None
     transactions = None
     currencies = None
+    precision_formatters = None  # (symbol, field, rounding mode) → (precision, precisionMode, formatter)
     options = None  # Python does not allow to define properties in run-time with setattr
     accounts = None
 
@@ -291,6 +368,12 @@ class Exchange(object):
     enableLastHttpResponse = True
     enableLastJsonResponse = True
     enableLastResponseHeaders = True
+    # False drops the raw response from the 'info' of parsed trades, orders, transactions, ledger entries
+    # and of the tickers filtered by filter_by_array
+    enableInfo = True
+    json_decoder = 'json'  # 'orjson', 'ujson', 'simdjson', 'auto' for the fastest one installed, or a callable
+    ohlcv_columns = False  # parse_ohlcvs returns OHLCVColumns instead of a list of candles
+    historyPageLimits = {}  # 'fetchOHLCV', 'fetchLedger', etc → the limit of the pages requested by iter_ohlcv, iter_ledger, etc
     last_http_response = None
     last_json_response = None
     last_response_headers = None
@@ -298,6 +381,22 @@ class Exchange(object):
     requiresWeb3 = False
     web3 = None
 
+    iso8601_pattern = re.compile(
+        '([0-9]{4})-?([0-9]{2})-?([0-9]{2})(?:T|[\\s])?([0-9]{2}):?([0-9]{2}):?([0-9]{2})(\\.[0-9]{1,3})?(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?',
+        re.IGNORECASE)
+    iso8601_days = {}  # days since the epoch → 'YYYY-MM-DDT'
+    iso8601_days_limit = 10000
+
+    # matched against the bodies of failed requests
+    ddos_protection_pattern = re.compile('(cloudflare|incapsula|overload|ddos)', re.IGNORECASE)
+    exchange_not_available_pattern = re.compile('(offline|busy|retry|wait|unavailable|maintain|maintenance|maintenancing)', re.IGNORECASE)
+
+    # the signing methods are static, their parsed keys are shared by all instances
+    signing_keys = collections.OrderedDict()  # (kind, secret, algorithm) → parsed key, most recently used last
+    signing_keys_lock = threading.Lock()
+    jwt_headers = {}  # alg → encoded header
+    ecdsa_multipliers = {}  # algorithm → native point multiplication or None
+
     commonCurrencies = {
         'XBT': 'BTC',
         'BCC': 'BCH',
@@ -314,10 +413,10 @@ class Exchange(object):
         self.headers = dict() if self.headers is None else self.headers
         self.balance = dict() if self.balance is None else self.balance
         self.orderbooks = dict() if self.orderbooks is None else self.orderbooks
-        self.orders = dict() if self.orders is None else self.orders
         self.trades = list() if self.trades is None else self.trades
         self.transactions = dict() if self.transactions is None else self.transactions
         self.currencies = dict() if self.currencies is None else self.currencies
+        self.precision_formatters = dict() if self.precision_formatters is None else self.precision_formatters
         self.options = dict() if self.options is None else self.options  # Python does not allow to define properties in run-time with setattr
         self.decimal_to_precision = decimal_to_precision
         self.number_to_string = number_to_string
@@ -338,23 +437,31 @@ class Exchange(object):
             else:
                 setattr(self, key, settings[key])
 
-        if self.api:
+        if not isinstance(self.orders, OrderCache):
+            orders = self.orders
+            self.orders = OrderCache(self.orders_cache_limit, self.orders_cache_max_age)
+            self.orders.update(orders or {})
+
+        # the generated api methods and the camelcase aliases of methods only depend on the class,
+        # they are defined once with the first instance, unless the api is overridden in config
+        cls = type(self)
+        define = ('_camelcase_properties' not in cls.__dict__) or ('api' in config)
+
+        if self.api and define:
             self.define_rest_api(self.api, 'request')
 
         if self.markets:
             self.set_markets(self.markets)
 
+        if define:
+            cls._camelcase_properties = self.define_camelcase_aliases()
+
         # convert all properties from underscore notation foo_bar to camelcase notation fooBar
-        cls = type(self)
-        for name in dir(self):
+        for name, camelcase in cls._camelcase_properties:
+            setattr(self, camelcase, getattr(self, name))
+        for name in list(self.__dict__.keys()):
             if name[0] != '_' and name[-1] != '_' and '_' in name:
-                parts = name.split('_')
-                camelcase = parts[0] + ''.join(self.capitalize(i) for i in parts[1:])
-                attr = getattr(self, name)
-                if isinstance(attr, types.MethodType):
-                    setattr(cls, camelcase, getattr(cls, name))
-                else:
-                    setattr(self, camelcase, attr)
+                self.define_camelcase_alias(name)
 
         self.tokenBucket = self.extend({
             'refillRate': 1.0 / self.rateLimit,
@@ -362,17 +469,51 @@ class Exchange(object):
             'capacity': 1.0,
             'defaultCost': 1.0,
         }, getattr(self, 'tokenBucket') if hasattr(self, 'tokenBucket') else {})
+        self.init_rest_rate_limiter()
 
-        self.session = self.session if self.session or self.asyncio_loop else Session()
+        self.session = self.session if self.session or self.asyncio_loop else self.create_session()
         self.logger = self.logger if self.logger else logging.getLogger(__name__)
+        self.json_loads = self.select_json_decoder(self.json_decoder)
 
-        if self.requiresWeb3 and Web3 and not self.web3:
+        if self.requiresWeb3 and not self.web3 and import_web3():
             self.web3 = Web3(HTTPProvider())
 
     def __del__(self):
         if self.session:
             self.session.close()
 
+    @staticmethod
+    def underscore_to_camelcase(name):
+        parts = name.split('_')
+        return parts[0] + ''.join(Exchange.capitalize(i) for i in parts[1:])
+
+    def define_camelcase_alias(self, name):
+        camelcase = self.underscore_to_camelcase(name)
+        attr = getattr(self, name)
+        if isinstance(attr, types.MethodType):
+            setattr(type(self), camelcase, getattr(type(self), name))
+        else:
+            setattr(self, camelcase, attr)
+        return camelcase
+
+    def define_camelcase_aliases(self):
+        """Aliases the methods of the class and returns the (name, alias) pairs of its other properties"""
+        properties = []
+        for name in dir(type(self)):
+            if name[0] != '_' and name[-1] != '_' and '_' in name:
+                camelcase = self.define_camelcase_alias(name)
+                if not isinstance(getattr(self, name), types.MethodType):
+                    properties.append((name, camelcase))
+        return properties
+
+    def create_session(self):
+        session = Session()
+        # size the pool for the threads sharing this instance, connections are kept alive between requests
+        adapter = KeepAliveHTTPAdapter(**self.requests_adapter_options)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
     def __repr__(self):
         return 'ccxt.' + ('async_support.' if self.asyncio_loop else '') + self.id + '()'
 
@@ -397,9 +538,12 @@ class Exchange(object):
     def define_rest_api(cls, api, method_name, options={}):
         delimiters = re.compile('[^a-zA-Z0-9]')
         entry = getattr(cls, method_name)  # returns a function (instead of a bound method)
+        costs = dict(cls.__dict__.get('apiCosts', {}))  # an api from config adds to the weights of the class
         for api_type, methods in api.items():
             for http_method, urls in methods.items():
-                for url in urls:
+                # a list of paths or a dict of paths to their rate limit weights
+                weighted_urls = urls.items() if isinstance(urls, dict) else [(url, None) for url in urls]
+                for url, cost in weighted_urls:
                     url = url.strip()
                     split_path = delimiters.split(url)
 
@@ -419,6 +563,9 @@ class Exchange(object):
                         if 'underscore' in options['suffixes']:
                             underscore += options['suffixes']['underscore']
 
+                    if cost is not None:
+                        costs[(api_type, uppercase_method, url)] = cost
+
                     def partialer():
                         outer_kwargs = {'path': url, 'api': api_type, 'method': uppercase_method}
 
@@ -437,18 +584,25 @@ class Exchange(object):
                     to_bind = partialer()
                     setattr(cls, camelcase, to_bind)
                     setattr(cls, underscore, to_bind)
+        cls.apiCosts = costs
+
+    def calculate_rate_limiter_cost(self, api, method, path, params):
+        """Returns the weight of an endpoint, override it for weights that depend on params"""
+        return self.apiCosts.get((api, method, path))
 
-    def throttle(self):
-        now = float(self.milliseconds())
-        elapsed = now - self.lastRestRequestTimestamp
-        if elapsed < self.rateLimit:
-            delay = self.rateLimit - elapsed
-            time.sleep(delay / 1000.0)
+    def init_rest_rate_limiter(self):
+        # thread-safe, one instance can be shared by a pool of workers
+        self.throttle = throttle(self.tokenBucket)
+        # api types listed in tokenBuckets are throttled independently from the rest
+        self.throttles = {}
+        for api_type, bucket in (self.tokenBuckets or {}).items():
+            self.throttles[api_type] = throttle(self.extend(self.tokenBucket, bucket))
 
     def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
         """A better wrapper over request for deferred signing"""
         if self.enableRateLimit:
-            self.throttle()
+            cost = self.calculate_rate_limiter_cost(api, method, path, params)
+            self.throttles.get(api, self.throttle)(cost)
         self.lastRestRequestTimestamp = self.milliseconds()
         request = self.sign(path, api, method, params, headers, body)
         return self.fetch(request['url'], request['method'], request['headers'], request['body'])
@@ -478,9 +632,7 @@ class Exchange(object):
 
     def find_broadly_matched_key(self, broad, string):
         """A helper method for matching error strings exactly vs broadly"""
-        keys = list(broad.keys())
-        for i in range(0, len(keys)):
-            key = keys[i]
+        for key in broad:
             if string.find(key) >= 0:
                 return key
         return None
@@ -582,26 +734,43 @@ class Exchange(object):
         if string_code in self.httpExceptions:
             error = self.httpExceptions[string_code]
             if error == ExchangeNotAvailable:
-                if re.search('(cloudflare|incapsula|overload|ddos)', body, flags=re.IGNORECASE):
+                if self.ddos_protection_pattern.search(body):
                     error = DDoSProtection
         if error:
             raise error(' '.join([method, url, string_code, http_status_text, body]))
 
     def handle_rest_response(self, response, json_response, url, method):
         if self.is_json_encoded_object(response) and json_response is None:
-            ddos_protection = re.search('(cloudflare|incapsula|overload|ddos)', response, flags=re.IGNORECASE)
-            exchange_not_available = re.search('(offline|busy|retry|wait|unavailable|maintain|maintenance|maintenancing)', response, flags=re.IGNORECASE)
-            if ddos_protection:
+            if self.ddos_protection_pattern.search(response):
                 raise DDoSProtection(' '.join([method, url, response]))
-            if exchange_not_available:
+            if self.exchange_not_available_pattern.search(response):
                 message = response + ' exchange downtime, exchange closed for maintenance or offline, DDoS protection or rate-limiting in effect'
                 raise ExchangeNotAvailable(' '.join([method, url, response, message]))
             raise ExchangeError(' '.join([method, url, response]))
 
+    @staticmethod
+    def select_json_decoder(decoder='json'):
+        if callable(decoder):
+            return decoder
+        if decoder == 'auto':
+            for name in ['orjson', 'ujson', 'simdjson']:
+                if name in json_decoders:
+                    return json_decoders[name]
+            return json.loads
+        if decoder not in json_decoders:
+            raise NotSupported('json_decoder ' + str(decoder) + ' is not installed')
+        return json_decoders[decoder]
+
     def parse_json(self, http_response):
         try:
             if Exchange.is_json_encoded_object(http_response):
-                return json.loads(http_response)
+                try:
+                    return self.json_loads(http_response)
+                except ValueError:
+                    # the stdlib decoder is more lenient (NaN, lone surrogates, etc)
+                    if self.json_loads is json.loads:
+                        raise
+                    return json.loads(http_response)
         except ValueError:  # superclass of JsonDecodeError (python2)
             pass
 
@@ -805,7 +974,7 @@ class Exchange(object):
     @staticmethod
     def index_by(array, key):
         result = {}
-        if type(array) is dict:
+        if isinstance(array, dict):
             array = Exchange.keysort(array).values()
         for element in array:
             if (key in element) and (element[key] is not None):
@@ -937,8 +1106,15 @@ class Exchange(object):
             return None
 
         try:
-            utc = datetime.datetime.utcfromtimestamp(timestamp // 1000)
-            return utc.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-6] + "{:03d}".format(int(timestamp) % 1000) + 'Z'
+            days, seconds = divmod(timestamp // 1000, 86400)
+            day = Exchange.iso8601_days.get(days)
+            if day is None:
+                date = datetime.datetime.utcfromtimestamp(days * 86400)
+                day = '%04d-%02d-%02dT' % (date.year, date.month, date.day)
+                if len(Exchange.iso8601_days) >= Exchange.iso8601_days_limit:
+                    Exchange.iso8601_days.clear()
+                Exchange.iso8601_days[days] = day
+            return day + '%02d:%02d:%02d.%03dZ' % (seconds // 3600, seconds // 60 % 60, seconds % 60, int(timestamp) % 1000)
         except (TypeError, OverflowError, OSError):
             return None
 
@@ -977,31 +1153,19 @@ class Exchange(object):
     def parse8601(timestamp=None):
         if timestamp is None:
             return timestamp
-        yyyy = '([0-9]{4})-?'
-        mm = '([0-9]{2})-?'
-        dd = '([0-9]{2})(?:T|[\\s])?'
-        h = '([0-9]{2}):?'
-        m = '([0-9]{2}):?'
-        s = '([0-9]{2})'
-        ms = '(\\.[0-9]{1,3})?'
-        tz = '(?:(\\+|\\-)([0-9]{2})\\:?([0-9]{2})|Z)?'
-        regex = r'' + yyyy + mm + dd + h + m + s + ms + tz
         try:
-            match = re.search(regex, timestamp, re.IGNORECASE)
+            match = Exchange.iso8601_pattern.search(timestamp)
             if match is None:
                 return None
             yyyy, mm, dd, h, m, s, ms, sign, hours, minutes = match.groups()
-            ms = ms or '.000'
-            msint = int(ms[1:])
-            sign = sign or ''
-            sign = int(sign + '1') * -1
-            hours = int(hours or 0) * sign
-            minutes = int(minutes or 0) * sign
-            offset = datetime.timedelta(hours=hours, minutes=minutes)
-            string = yyyy + mm + dd + h + m + s + ms + 'Z'
-            dt = datetime.datetime.strptime(string, "%Y%m%d%H%M%S.%fZ")
-            dt = dt + offset
-            return calendar.timegm(dt.utctimetuple()) * 1000 + msint
+            msint = int(ms[1:]) if ms else 0
+            # the datetime validates the fields, the rest is integer arithmetic
+            dt = datetime.datetime(int(yyyy), int(mm), int(dd), int(h), int(m), int(s))
+            if sign:
+                sign = -1 if sign == '+' else 1
+                dt = dt + datetime.timedelta(hours=int(hours) * sign, minutes=int(minutes) * sign)
+            seconds = (dt.toordinal() - 719163) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+            return seconds * 1000 + msint
         except (TypeError, OverflowError, OSError, ValueError):
             return None
 
@@ -1014,9 +1178,33 @@ class Exchange(object):
             return base64.b64encode(h.digest())
         return h.digest()
 
+    @staticmethod
+    def signing_key(kind, secret, algorithm, parse):
+        """Returns parse(), called once for each of the most recently used secrets of a kind and an algorithm"""
+        if not Exchange.signing_keys_limit:
+            return parse()
+        key = (kind, secret, algorithm)
+        try:
+            with Exchange.signing_keys_lock:
+                if key in Exchange.signing_keys:
+                    result = Exchange.signing_keys.pop(key)
+                    Exchange.signing_keys[key] = result
+                    return result
+        except TypeError:  # unhashable secrets are not cached
+            return parse()
+        # parsed outside of the lock, concurrent threads may parse the same secret twice
+        result = parse()
+        with Exchange.signing_keys_lock:
+            Exchange.signing_keys[key] = result
+            while len(Exchange.signing_keys) > Exchange.signing_keys_limit:
+                Exchange.signing_keys.popitem(last=False)
+        return result
+
     @staticmethod
     def hmac(request, secret, algorithm=hashlib.sha256, digest='hex'):
-        h = hmac.new(secret, request, algorithm)
+        # the keyed inner and outer hashes are computed once per secret and copied
+        h = Exchange.signing_key('hmac', secret, algorithm, lambda: hmac.new(secret, None, algorithm)).copy()
+        h.update(request)
         if digest == 'hex':
             return h.hexdigest()
         elif digest == 'base64':
@@ -1052,11 +1240,13 @@ class Exchange(object):
             'HS384': hashlib.sha384,
             'HS512': hashlib.sha512,
         }
-        header = Exchange.encode(Exchange.json({
-            'alg': alg,
-            'typ': 'JWT',
-        }))
-        encoded_header = Exchange.base64urlencode(header)
+        if alg not in Exchange.jwt_headers:
+            header = Exchange.encode(Exchange.json({
+                'alg': alg,
+                'typ': 'JWT',
+            }))
+            Exchange.jwt_headers[alg] = Exchange.base64urlencode(header)
+        encoded_header = Exchange.jwt_headers[alg]
         encoded_data = Exchange.base64urlencode(Exchange.encode(Exchange.json(request)))
         token = encoded_header + '.' + encoded_data
         if alg[:2] == 'RS':
@@ -1068,18 +1258,23 @@ class Exchange(object):
 
     @staticmethod
     def rsa(request, secret, alg='RS256'):
+        from cryptography.hazmat import backends
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
         algorithms = {
             "RS256": hashes.SHA256(),
             "RS384": hashes.SHA384(),
             "RS512": hashes.SHA512(),
         }
         algorithm = algorithms[alg]
-        priv_key = load_pem_private_key(secret, None, backends.default_backend())
+        priv_key = Exchange.signing_key('rsa', secret, None, lambda: load_pem_private_key(secret, None, backends.default_backend()))
         return priv_key.sign(Exchange.encode(request), padding.PKCS1v15(), algorithm)
 
     @staticmethod
     def ecdsa(request, secret, algorithm='p256', hash=None, fixed_length=False):
         # your welcome - frosty00
+        from ccxt.static_dependencies import ecdsa
         algorithms = {
             'p192': [ecdsa.NIST192p, 'sha256'],
             'p224': [ecdsa.NIST224p, 'sha256'],
@@ -1097,19 +1292,29 @@ class Exchange(object):
             digest = Exchange.hash(encoded_request, hash, 'binary')
         else:
             digest = base64.b16decode(encoded_request, casefold=True)
-        key = ecdsa.SigningKey.from_string(base64.b16decode(Exchange.encode(secret),
-                                                            casefold=True), curve=curve_info[0])
-        r_binary, s_binary, v = key.sign_digest_deterministic(digest, hashfunc=hash_function,
-                                                              sigencode=ecdsa.util.sigencode_strings_canonize)
-        r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), key.privkey.order)
+        curve = curve_info[0]
+        multiply = Exchange.ecdsa_multiplier(algorithm) if len(digest) <= curve.baselen else None
+        if multiply is None:
+            key = Exchange.signing_key('ecdsa', secret, algorithm, lambda: ecdsa.SigningKey.from_string(
+                base64.b16decode(Exchange.encode(secret), casefold=True), curve=curve))
+
+            def sign(extra_entropy=b''):
+                return key.sign_digest_deterministic(digest, hashfunc=hash_function,
+                                                     sigencode=ecdsa.util.sigencode_strings_canonize,
+                                                     extra_entropy=extra_entropy)
+        else:
+            secexp = Exchange.signing_key('ecdsa-secexp', secret, algorithm, lambda: Exchange.ecdsa_secret_exponent(secret, curve))
+
+            def sign(extra_entropy=b''):
+                return Exchange.ecdsa_sign_digest(multiply, curve, secexp, digest, hash_function, extra_entropy)
+        r_binary, s_binary, v = sign()
+        r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), curve.order)
         counter = 0
         minimum_size = (1 << (8 * 31)) - 1
-        half_order = key.privkey.order / 2
+        half_order = curve.order / 2
         while fixed_length and (r_int > half_order or r_int <= minimum_size or s_int <= minimum_size):
-            r_binary, s_binary, v = key.sign_digest_deterministic(digest, hashfunc=hash_function,
-                                                                  sigencode=ecdsa.util.sigencode_strings_canonize,
-                                                                  extra_entropy=Exchange.numberToLE(counter, 32))
-            r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), key.privkey.order)
+            r_binary, s_binary, v = sign(Exchange.numberToLE(counter, 32))
+            r_int, s_int = ecdsa.util.sigdecode_strings((r_binary, s_binary), curve.order)
             counter += 1
         r, s = Exchange.decode(base64.b16encode(r_binary)).lower(), Exchange.decode(base64.b16encode(s_binary)).lower()
         return {
@@ -1118,6 +1323,103 @@ class Exchange(object):
             'v': v,
         }
 
+    @staticmethod
+    def ecdsa_secret_exponent(secret, curve):
+        # the validation of SigningKey.from_string without the slow computation of the public key
+        from ccxt.static_dependencies import ecdsa
+        string = base64.b16decode(Exchange.encode(secret), casefold=True)
+        assert len(string) == curve.baselen, (len(string), curve.baselen)
+        secexp = ecdsa.util.string_to_number(string)
+        assert 1 <= secexp < curve.order
+        return secexp
+
+    @staticmethod
+    def ecdsa_multiplier(algorithm):
+        """Returns a function computing the coordinates of k times the generator of a curve with coincurve
+        or cryptography, or None when neither supports the curve and the vendored ecdsa has to be used"""
+        if algorithm not in Exchange.ecdsa_multipliers:
+            Exchange.ecdsa_multipliers[algorithm] = Exchange.load_ecdsa_multiplier(algorithm)
+        return Exchange.ecdsa_multipliers[algorithm]
+
+    @staticmethod
+    def load_ecdsa_multiplier(algorithm):
+        from ccxt.static_dependencies import ecdsa
+        curve = {
+            'p192': ecdsa.NIST192p,
+            'p224': ecdsa.NIST224p,
+            'p256': ecdsa.NIST256p,
+            'p384': ecdsa.NIST384p,
+            'p521': ecdsa.NIST521p,
+            'secp256k1': ecdsa.SECP256k1,
+        }[algorithm]
+        multipliers = []
+        if algorithm == 'secp256k1':
+            try:
+                import coincurve
+
+                def multiply_coincurve(k):
+                    return coincurve.PublicKey.from_secret(ecdsa.util.number_to_string(k, curve.order)).point()
+
+                multipliers.append(multiply_coincurve)
+            except ImportError:
+                pass
+        try:
+            from cryptography.hazmat import backends
+            from cryptography.hazmat.primitives.asymmetric import ec
+            native_curve = {
+                'p192': ec.SECP192R1,
+                'p224': ec.SECP224R1,
+                'p256': ec.SECP256R1,
+                'p384': ec.SECP384R1,
+                'p521': ec.SECP521R1,
+                'secp256k1': ec.SECP256K1,
+            }[algorithm]()
+            backend = backends.default_backend()
+
+            def multiply_cryptography(k):
+                numbers = ec.derive_private_key(k, native_curve, backend).public_key().public_numbers()
+                return numbers.x, numbers.y
+
+            multipliers.append(multiply_cryptography)
+        except ImportError:
+            pass
+        # a backend is used if it is available for the curve and agrees with the vendored generator
+        generator = curve.generator
+        for multiply in multipliers:
+            try:
+                if multiply(1) == (generator.x(), generator.y()) and multiply(2) == ((generator * 2).x(), (generator * 2).y()):
+                    return multiply
+            except Exception:
+                pass
+        return None
+
+    @staticmethod
+    def ecdsa_sign_digest(multiply, curve, secexp, digest, hash_function, extra_entropy=b''):
+        """SigningKey.sign_digest_deterministic with sigencode_strings_canonize, with the point multiplication done natively"""
+        from ccxt.static_dependencies import ecdsa
+        from ccxt.static_dependencies.ecdsa import rfc6979
+        order = curve.order
+        number = ecdsa.util.string_to_number(digest)
+        retry_gen = 0
+        while True:
+            k = rfc6979.generate_k(order, secexp, hash_function, digest, retry_gen=retry_gen, extra_entropy=extra_entropy)
+            x, y = multiply(k)
+            r = x % order
+            s = (Exchange.inverse_mod(k, order) * (number + (secexp * r) % order)) % order
+            if r != 0 and s != 0:
+                break
+            retry_gen += 1
+        v = y % 2 or (2 if x == k else 0)
+        return ecdsa.util.sigencode_strings_canonize(r, s, order, v)
+
+    @staticmethod
+    def inverse_mod(a, m):
+        try:
+            return pow(a, -1, m)  # python 3.8+
+        except (TypeError, ValueError):
+            from ccxt.static_dependencies.ecdsa import numbertheory
+            return numbertheory.inverse_mod(a, m)
+
     @staticmethod
     def unjson(input):
         return json.loads(input)
@@ -1142,7 +1444,7 @@ class Exchange(object):
 
     @staticmethod
     def to_array(value):
-        return list(value.values()) if type(value) is dict else value
+        return list(value.values()) if isinstance(value, dict) else value
 
     def nonce(self):
         return Exchange.seconds()
@@ -1190,17 +1492,59 @@ class Exchange(object):
         parts = re.sub(r'0+$', '', string).split('.')
         return len(parts[1]) if len(parts) > 1 else 0
 
+    def market_precision_formatter(self, symbol, field, rounding_mode):
+        """Returns the formatter of a precision field of a market, built once and rebuilt when the precision changes"""
+        precision = self.markets[symbol]['precision'][field]
+        key = (symbol, field, rounding_mode)
+        cached = self.precision_formatters.get(key)
+        # 10 and 10.0 are different tick sizes to decimal_to_precision
+        if (cached is None) or (cached[0] != precision) or (type(cached[0]) is not type(precision)) or (cached[1] != self.precisionMode):
+            cached = (precision, self.precisionMode, precision_formatter(rounding_mode, precision, self.precisionMode))
+            self.precision_formatters[key] = cached
+        return cached[2]
+
     def cost_to_precision(self, symbol, cost):
-        return self.decimal_to_precision(cost, ROUND, self.markets[symbol]['precision']['price'], self.precisionMode)
+        return self.market_precision_formatter(symbol, 'price', ROUND)(cost)
 
     def price_to_precision(self, symbol, price):
-        return self.decimal_to_precision(price, ROUND, self.markets[symbol]['precision']['price'], self.precisionMode)
+        return self.market_precision_formatter(symbol, 'price', ROUND)(price)
 
     def amount_to_precision(self, symbol, amount):
-        return self.decimal_to_precision(amount, TRUNCATE, self.markets[symbol]['precision']['amount'], self.precisionMode)
+        return self.market_precision_formatter(symbol, 'amount', TRUNCATE)(amount)
 
     def fee_to_precision(self, symbol, fee):
-        return self.decimal_to_precision(fee, ROUND, self.markets[symbol]['precision']['price'], self.precisionMode)
+        return self.market_precision_formatter(symbol, 'price', ROUND)(fee)
+
+    def amounts_to_precision(self, symbols, amounts, as_float=False):
+        """Formats a list of amounts of one symbol, or of a list of symbols of the same length"""
+        return self.values_to_precision('amount_to_precision', 'amount', TRUNCATE, symbols, amounts, as_float)
+
+    def prices_to_precision(self, symbols, prices, as_float=False):
+        """Formats a list of prices of one symbol, or of a list of symbols of the same length"""
+        return self.values_to_precision('price_to_precision', 'price', ROUND, symbols, prices, as_float)
+
+    def values_to_precision(self, method, field, rounding_mode, symbols, values, as_float=False):
+        # the formatter of each market is looked up once per call, unless the exchange overrides the method
+        overridden = getattr(type(self), method) != getattr(Exchange, method)
+
+        def formatter(symbol):
+            if overridden:
+                return functools.partial(getattr(self, method), symbol)
+            return self.market_precision_formatter(symbol, field, rounding_mode)
+
+        if isinstance(symbols, basestring):
+            format = formatter(symbols)
+            result = [format(value) for value in values]
+        else:
+            if len(symbols) != len(values):
+                raise ExchangeError(self.id + ' ' + method + ' requires as many symbols as values')
+            formatters = {}
+            result = []
+            for symbol, value in zip(symbols, values):
+                if symbol not in formatters:
+                    formatters[symbol] = formatter(symbol)
+                result.append(formatters[symbol](value))
+        return [float(value) for value in result] if as_float else result
 
     def currency_to_precision(self, currency, fee):
         return self.decimal_to_precision(fee, ROUND, self.currencies[currency]['precision'], self.precisionMode)
@@ -1213,13 +1557,10 @@ class Exchange(object):
                 {'precision': self.precision, 'limits': self.limits},
                 values[i]
             )
-        self.markets = self.index_by(values, 'symbol')
-        self.markets_by_id = self.index_by(values, 'id')
-        self.marketsById = self.markets_by_id
-        self.symbols = sorted(list(self.markets.keys()))
-        self.ids = sorted(list(self.markets_by_id.keys()))
+        markets = self.index_by(values, 'symbol')
+        markets_by_id = self.index_by(values, 'id')
         if currencies:
-            self.currencies = self.deep_extend(currencies, self.currencies)
+            currencies = self.deep_extend(currencies, self.currencies)
         else:
             base_currencies = [{
                 'id': market['baseId'] if 'baseId' in market else market['base'],
@@ -1242,9 +1583,13 @@ class Exchange(object):
                 ) if 'precision' in market else 8,
             } for market in values if 'quote' in market]
             currencies = self.sort_by(base_currencies + quote_currencies, 'code')
-            self.currencies = self.deep_extend(self.index_by(currencies, 'code'), self.currencies)
-        self.currencies_by_id = self.index_by(list(self.currencies.values()), 'id')
-        return self.markets
+            currencies = self.deep_extend(self.index_by(currencies, 'code'), self.currencies)
+        currencies_by_id = self.index_by(list(currencies.values()), 'id')
+        # the new tables are built first and swapped in at once, so that the threads using the markets
+        # while they are reloaded in the background (see markets_cache_ttl) see either the old set or the new one
+        self.markets, self.markets_by_id, self.marketsById, self.symbols, self.ids, self.currencies, self.currencies_by_id, self.precision_formatters = (
+            markets, markets_by_id, markets_by_id, sorted(list(markets.keys())), sorted(list(markets_by_id.keys())), currencies, currencies_by_id, {})
+        return markets
 
     def load_markets(self, reload=False, params={}):
         if not reload:
@@ -1252,12 +1597,91 @@ class Exchange(object):
                 if not self.markets_by_id:
                     return self.set_markets(self.markets)
                 return self.markets
+            cache = self.read_markets_cache()
+            if cache:
+                if self.markets_cache_is_stale(cache) and not self._markets_cache_refresh:
+                    self._markets_cache_refresh = threading.Thread(target=self.refresh_markets_cache, args=(params,))
+                    self._markets_cache_refresh.daemon = True
+                    self._markets_cache_refresh.start()
+                return self.set_markets(cache['markets'], cache['currencies'])
         currencies = None
         if self.has['fetchCurrencies']:
             currencies = self.fetch_currencies()
         markets = self.fetch_markets(params)
+        self.write_markets_cache(markets, currencies)
         return self.set_markets(markets, currencies)
 
+    def share_markets_from(self, exchange):
+        """Attaches the markets loaded by another instance of the same exchange instead of loading a copy of them"""
+        if exchange.id != self.id:
+            raise ExchangeError(self.id + ' can not share the markets of ' + exchange.id)
+        if not exchange.markets:
+            raise ExchangeError(exchange.id + ' markets are not loaded yet')
+        # set_markets replaces the tables instead of updating them, reloading the markets of either instance detaches it
+        self.markets = exchange.markets
+        self.markets_by_id = self.marketsById = exchange.markets_by_id
+        self.symbols = exchange.symbols
+        self.ids = exchange.ids
+        self.currencies = exchange.currencies
+        self.currencies_by_id = exchange.currencies_by_id
+        return self.markets
+
+    def refresh_markets_cache(self, params={}):
+        try:
+            self.load_markets(True, params)
+        except Exception as e:
+            self.logger.warning('%s failed to reload the cached markets: %s', self.id, e)
+        finally:
+            self._markets_cache_refresh = None
+
+    def markets_cache_path(self):
+        # sandbox markets are cached separately from the production ones
+        sandbox = '-sandbox' if 'api_backup' in self.urls else ''
+        return os.path.join(self.markets_cache_dir, self.id + sandbox + '.json')
+
+    def markets_cache_is_stale(self, cache):
+        return cache['timestamp'] + self.markets_cache_ttl < self.milliseconds()
+
+    def read_markets_cache(self):
+        if not self.markets_cache_dir:
+            return None
+        try:
+            with open(self.markets_cache_path(), 'rb') as f:
+                cache = self.json_loads(f.read())
+        except (IOError, OSError, ValueError):  # not cached yet or a partial write
+            return None
+        if not isinstance(cache, dict) or cache.get('version') != __version__:
+            return None  # markets parsed by another version of the library
+        return cache
+
+    def write_markets_cache(self, markets, currencies=None):
+        if not self.markets_cache_dir:
+            return
+        if not self.enableInfo:
+            markets = [self.extend(market, {'info': None}) for market in self.to_array(markets)]
+        path = self.markets_cache_path()
+        temporary = path + '.' + self.uuid()
+        try:
+            data = json.dumps({
+                'version': __version__,
+                'timestamp': self.milliseconds(),
+                'markets': markets,
+                'currencies': currencies,
+            }, separators=(',', ':'))
+            if not os.path.isdir(self.markets_cache_dir):
+                try:
+                    os.makedirs(self.markets_cache_dir)
+                except OSError:  # created by another process meanwhile
+                    pass
+            with open(temporary, 'w') as f:
+                f.write(data)
+            # other processes read either the previous or the new file, never a partial one
+            getattr(os, 'replace', os.rename)(temporary, path)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            self.logger.warning('%s failed to cache the markets in %s: %s', self.id, path, e)
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
     def load_accounts(self, reload=False, params={}):
         if reload:
             self.accounts = self.fetch_accounts(params)
@@ -1290,6 +1714,10 @@ class Exchange(object):
         # and may be changed for consistency later
         return self.currencies
 
+    def gather(self, results):
+        # the counterpart of the async gather, the requests have already been made one by one
+        return list(results)
+
     def fetch_fees(self):
         trading = {}
         funding = {}
@@ -1322,10 +1750,16 @@ class Exchange(object):
         return order['status']
 
     def purge_cached_orders(self, before):
-        orders = self.to_array(self.orders)
-        orders = [order for order in orders if (order['status'] == 'open') or (order['timestamp'] >= before)]
-        self.orders = self.index_by(orders, 'id')
-        return self.orders
+        return self.orders.purge(before)
+
+    def reconcile_cached_orders(self, open_orders, symbol=None):
+        # stores a fresh list of the open orders of a symbol or of all symbols, the cached open orders absent
+        # from it were closed or canceled externally (unnoticed by "us"), returns the cached orders of the symbol
+        self.orders.reconcile(open_orders, symbol)
+        return self.orders.select(symbol)
+
+    def select_cached_orders(self, symbol=None, status=None):
+        return self.orders.select(symbol, status)
 
     def fetch_order(self, id, symbol=None, params={}):
         raise NotSupported('fetch_order() is not supported yet')
@@ -1359,18 +1793,15 @@ class Exchange(object):
 
     def parse_ohlcvs(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
         ohlcvs = self.to_array(ohlcvs)
-        num_ohlcvs = len(ohlcvs)
-        result = []
-        i = 0
-        while i < num_ohlcvs:
-            if limit and (len(result) >= limit):
-                break
-            ohlcv = self.parse_ohlcv(ohlcvs[i], market, timeframe, since, limit)
-            i = i + 1
-            if since and (ohlcv[0] < since):
-                continue
-            result.append(ohlcv)
-        return self.sort_by(result, 0)
+        result = (self.parse_ohlcv(ohlcv, market, timeframe, since, limit) for ohlcv in ohlcvs)
+        if since:
+            result = (ohlcv for ohlcv in result if ohlcv[0] >= since)
+        if limit:
+            result = itertools.islice(result, limit)
+        if self.ohlcv_columns:
+            # the parsed candles go straight into the columns, one at a time
+            return OHLCVColumns.from_rows(result).sort()
+        return self.sort_by(list(result), 0)
 
     def parse_bid_ask(self, bidask, price_key=0, amount_key=0):
         return [float(bidask[price_key]), float(bidask[amount_key])]
@@ -1487,6 +1918,84 @@ class Exchange(object):
     def fetchOHLCV(self, symbol, timeframe='1m', since=None, limit=None, params={}):
         return self.fetch_ohlcv(symbol, timeframe, since, limit, params)
 
+    def iter_history(self, method, args, since=None, until=None, limit=None, params={}, step=0):
+        """Yields the history returned by a fetch method page by page, from since up to until"""
+        state = self.init_history_state(since, until)
+        limit = limit if limit else self.historyPageLimits.get(method)
+        while not state['done']:
+            page = getattr(self, method)(*(args + [state['since'], limit, params]))
+            for entry in self.next_history_page(page, state, step):
+                yield entry
+
+    def iter_ohlcv(self, symbol, timeframe='1m', since=None, until=None, limit=None, params={}):
+        return self.iter_history('fetchOHLCV', [symbol, timeframe], since, until, limit, params, self.parse_timeframe(timeframe) * 1000)
+
+    def iter_trades(self, symbol, since=None, until=None, limit=None, params={}):
+        return self.iter_history('fetchTrades', [symbol], since, until, limit, params)
+
+    def iter_my_trades(self, symbol=None, since=None, until=None, limit=None, params={}):
+        return self.iter_history('fetchMyTrades', [symbol], since, until, limit, params)
+
+    def iter_orders(self, symbol=None, since=None, until=None, limit=None, params={}):
+        return self.iter_history('fetchOrders', [symbol], since, until, limit, params)
+
+    def iter_transactions(self, code=None, since=None, until=None, limit=None, params={}):
+        return self.iter_history('fetchTransactions', [code], since, until, limit, params)
+
+    def iter_ledger(self, code=None, since=None, until=None, limit=None, params={}):
+        return self.iter_history('fetchLedger', [code], since, until, limit, params)
+
+    @staticmethod
+    def init_history_state(since=None, until=None):
+        return {
+            'since': since,
+            'until': until,
+            'seen': set(),  # the entries of the previous page, pages overlap at their boundary
+            'stalled': False,
+            'done': False,
+        }
+
+    def next_history_page(self, page, state, step=0):
+        """Returns the entries of a page that were not returned yet and advances the state to the next page
+
+        A page is requested from the last timestamp of the previous one plus step, which is the duration
+        of a candle for ohlcv and 0 for the rest, as more than one entry can have the same timestamp.
+        When a page brings nothing new, the next one is requested 1 ms later, and when that does not
+        help either the history is over, this also stops at exchanges that ignore since.
+        """
+        since = state['since']
+        until = state['until']
+        seen = set()
+        result = []
+        last = None
+        for entry in page:
+            if isinstance(entry, list):
+                timestamp = entry[0]
+                key = timestamp
+            else:
+                timestamp = entry['timestamp']
+                key = entry.get('id')
+                if key is None:
+                    key = (timestamp, entry.get('side'), entry.get('price'), entry.get('amount'))
+            seen.add(key)
+            if timestamp is None:
+                continue
+            last = timestamp if (last is None) or (timestamp > last) else last
+            if (key not in state['seen']) and ((since is None) or (timestamp >= since)) and ((until is None) or (timestamp < until)):
+                result.append(entry)
+        state['seen'] = seen
+        if (last is None) or ((until is not None) and (last + step >= until)):
+            state['done'] = True
+        elif result:
+            state['stalled'] = False
+            state['since'] = last + step
+        elif state['stalled']:
+            state['done'] = True
+        else:
+            state['stalled'] = True
+            state['since'] = max(last, since or 0) + 1
+        return result
+
     def parse_trading_view_ohlcv(self, ohlcvs, market=None, timeframe='1m', since=None, limit=None):
         result = self.convert_trading_view_to_ohlcv(ohlcvs)
         return self.parse_ohlcvs(result, market, timeframe, since, limit)
@@ -1505,6 +2014,8 @@ class Exchange(object):
         return result
 
     def convert_ohlcv_to_trading_view(self, ohlcvs):
+        if isinstance(ohlcvs, OHLCVColumns):
+            return ohlcvs.to_trading_view()
         result = {
             't': [],
             'o': [],
@@ -1523,34 +2034,18 @@ class Exchange(object):
         return result
 
     def build_ohlcv(self, trades, timeframe='1m', since=None, limit=None):
-        ms = self.parse_timeframe(timeframe) * 1000
-        ohlcvs = []
-        (high, low, close, volume) = (2, 3, 4, 5)
-        num_trades = len(trades)
-        oldest = (num_trades - 1) if limit is None else min(num_trades - 1, limit)
-        for i in range(0, oldest):
-            trade = trades[i]
-            if (since is not None) and (trade['timestamp'] < since):
-                continue
-            opening_time = int(math.floor(trade['timestamp'] / ms) * ms)  # Shift the edge of the m/h/d (but not M)
-            j = len(ohlcvs)
-            if (j == 0) or opening_time >= ohlcvs[j - 1][0] + ms:
-                # moved to a new timeframe -> create a new candle from opening trade
-                ohlcvs.append([
-                    opening_time,
-                    trade['price'],
-                    trade['price'],
-                    trade['price'],
-                    trade['price'],
-                    trade['amount'],
-                ])
-            else:
-                # still processing the same timeframe -> update opening trade
-                ohlcvs[j - 1][high] = max(ohlcvs[j - 1][high], trade['price'])
-                ohlcvs[j - 1][low] = min(ohlcvs[j - 1][low], trade['price'])
-                ohlcvs[j - 1][close] = trade['price']
-                ohlcvs[j - 1][volume] += trade['amount']
-        return ohlcvs
+        trades = trades if limit is None else trades[0:limit]
+        if since is not None:
+            trades = [trade for trade in trades if trade['timestamp'] >= since]
+        return self.ohlcv_builder([timeframe]).update(trades).ohlcvs(timeframe)
+
+    def resample_ohlcv(self, ohlcvs, timeframe, fill_gaps=False):
+        """Aggregates sorted candles into a coarser timeframe, 1w, 1M and 1y candles are aligned to the calendar"""
+        return resample_ohlcv(ohlcvs, Timeframe(timeframe, self.parse_timeframe(timeframe)), fill_gaps)
+
+    def ohlcv_builder(self, timeframes=['1m']):
+        """Returns an OHLCVBuilder that builds the candles of several timeframes from batches of trades"""
+        return OHLCVBuilder(dict((timeframe, self.parse_timeframe(timeframe) * 1000) for timeframe in timeframes))
 
     @staticmethod
     def parse_timeframe(timeframe):
@@ -1582,38 +2077,57 @@ class Exchange(object):
         return timestamp - offset + (ms if direction == ROUND_UP else 0)
 
     def parse_trades(self, trades, market=None, since=None, limit=None, params={}):
-        array = self.to_array(trades)
-        array = [self.extend(self.parse_trade(trade, market), params) for trade in array]
-        array = self.sort_by(array, 'timestamp')
+        params = params if self.enableInfo else self.extend(params, {'info': None})
+        array = [self.parse_trade(trade, market) for trade in self.to_array(trades)]
+        array = [self.extend(trade, params) for trade in array] if params else array
         symbol = market['symbol'] if market else None
-        return self.filter_by_symbol_since_limit(array, symbol, since, limit)
+        return self.sort_and_filter_by_value_since_limit(array, 'symbol', symbol, since, limit)
 
     def parse_ledger(self, data, currency=None, since=None, limit=None, params={}):
+        params = params if self.enableInfo else self.extend(params, {'info': None})
         array = self.to_array(data)
         result = []
         for item in array:
             entry = self.parse_ledger_entry(item, currency)
             if isinstance(entry, list):
-                result += [self.extend(i, params) for i in entry]
+                result += entry
             else:
-                result.append(self.extend(entry, params))
-        result = self.sort_by(result, 'timestamp')
+                result.append(entry)
+        result = [self.extend(entry, params) for entry in result] if params else result
         code = currency['code'] if currency else None
-        return self.filter_by_currency_since_limit(result, code, since, limit)
+        return self.sort_and_filter_by_value_since_limit(result, 'currency', code, since, limit)
 
     def parse_transactions(self, transactions, currency=None, since=None, limit=None, params={}):
-        array = self.to_array(transactions)
-        array = [self.extend(self.parse_transaction(transaction, currency), params) for transaction in array]
-        array = self.sort_by(array, 'timestamp')
+        params = params if self.enableInfo else self.extend(params, {'info': None})
+        array = [self.parse_transaction(transaction, currency) for transaction in self.to_array(transactions)]
+        array = [self.extend(transaction, params) for transaction in array] if params else array
         code = currency['code'] if currency else None
-        return self.filter_by_currency_since_limit(array, code, since, limit)
+        return self.sort_and_filter_by_value_since_limit(array, 'currency', code, since, limit)
 
     def parse_orders(self, orders, market=None, since=None, limit=None, params={}):
-        array = self.to_array(orders)
-        array = [self.extend(self.parse_order(order, market), params) for order in array]
-        array = self.sort_by(array, 'timestamp')
+        params = params if self.enableInfo else self.extend(params, {'info': None})
+        array = [self.parse_order(order, market) for order in self.to_array(orders)]
+        array = [self.extend(order, params) for order in array] if params else array
         symbol = market['symbol'] if market else None
-        return self.filter_by_symbol_since_limit(array, symbol, since, limit)
+        return self.sort_and_filter_by_value_since_limit(array, 'symbol', symbol, since, limit)
+
+    def sort_and_filter_by_value_since_limit(self, array, field, value=None, since=None, limit=None):
+        """Equivalent to sort_by(array, 'timestamp') followed by filter_by_value_since_limit, in fewer passes"""
+        if value or since:
+            array = [entry for entry in array if (not value or entry[field] == value) and (not since or entry['timestamp'] >= since)]
+        timestamps = [entry['timestamp'] for entry in array]
+        if None in timestamps:
+            array = self.sort_by(array, 'timestamp')
+        elif all(timestamps[i] <= timestamps[i + 1] for i in range(0, len(timestamps) - 1)):
+            pass  # already sorted
+        elif all(timestamps[i] > timestamps[i + 1] for i in range(0, len(timestamps) - 1)):
+            array = array[::-1]  # newest first, without equal timestamps to keep in their original order
+        else:
+            # both sorts are stable, the partial one only keeps the first limit elements
+            order = range(0, len(array))
+            order = heapq.nsmallest(limit, order, key=timestamps.__getitem__) if limit else sorted(order, key=timestamps.__getitem__)
+            return [array[i] for i in order]
+        return array[0:limit] if limit else array
 
     def safe_currency_code(self, currency_id, currency=None):
         code = None
@@ -1659,6 +2173,8 @@ class Exchange(object):
     def filter_by_array(self, objects, key, values=None, indexed=True):
 
         objects = self.to_array(objects)
+        if not self.enableInfo:
+            objects = [self.extend(o, {'info': None}) if 'info' in o else o for o in objects]
 
         # return all of them if no values were passed in
         if values is None:
@@ -1762,7 +2278,7 @@ class Exchange(object):
 
     @staticmethod
     def has_web3():
-        return Web3 is not None
+        return import_web3() is not None
 
     def check_required_dependencies(self):
         if not Exchange.has_web3():
@@ -1813,7 +2329,7 @@ class Exchange(object):
         return self.safe_value(units, decimals)
 
     def fromWei(self, amount, unit='ether', decimals=18):
-        if Web3 is None:
+        if import_web3() is None:
             raise NotSupported("ethereum web3 methods require Python 3: https://pythonclock.org")
         if amount is None:
             return amount
@@ -1825,7 +2341,7 @@ class Exchange(object):
         return float(Web3.fromWei(int(amount), unit))
 
     def toWei(self, amount, unit='ether', decimals=18):
-        if Web3 is None:
+        if import_web3() is None:
             raise NotSupported("ethereum web3 methods require Python 3: https://pythonclock.org")
         if amount is None:
             return amount
@@ -1841,6 +2357,7 @@ class Exchange(object):
         return str(Web3.toWei(amount, unit))
 
     def privateKeyToAddress(self, privateKey):
+        from ccxt.static_dependencies import ecdsa
         private_key_bytes = base64.b16decode(Exchange.encode(privateKey), True)
         public_key_bytes = ecdsa.SigningKey.from_string(private_key_bytes, curve=ecdsa.SECP256k1).verifying_key.to_string()
         public_key_hash = self.web3.sha3(public_key_bytes)
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+import calendar
+import time
+
+
+__all__ = [
+    'OHLCVBuilder',
+    'OHLCVColumns',
+    'Timeframe',
+    'resample_ohlcv',
+]
+
+# -----------------------------------------------------------------------------
+
+try:
+    array('q')
+    INT64 = 'q'
+except ValueError:  # Python 2
+    INT64 = 'd'
+
+FLOAT64 = 'd'
+NAN = float('nan')
+
+# numpy is imported on first use of the columns, not with ccxt, the columns are array.array without it
+numpy = None
+numpy_imported = False
+
+
+def get_numpy():
+    global numpy, numpy_imported
+    if not numpy_imported:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        numpy_imported = True
+    return numpy
+
+
+def column(values, typecode):
+    if get_numpy() is not None:
+        dtype = numpy.int64 if typecode == INT64 else numpy.float64
+        if isinstance(values, array):
+            return numpy.frombuffer(values, dtype=dtype) if len(values) else numpy.zeros(0, dtype=dtype)
+        return numpy.asarray(values, dtype=dtype)  # no copy if it is an array of that type already
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    return array(typecode, values)
+
+
+class OHLCVColumns(object):
+    """Candles stored in columns, an int64 column of timestamps and float64 columns of open, high, low,
+    close and volume prices, numpy arrays if numpy is installed and array.array otherwise
+
+    Indexing and iteration produce [timestamp, open, high, low, close, volume] rows like a list of
+    candles, slices are OHLCVColumns. Missing values are stored as nan.
+    """
+
+    fields = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+    typecodes = (INT64, FLOAT64, FLOAT64, FLOAT64, FLOAT64, FLOAT64)
+
+    def __init__(self, timestamp=(), open=(), high=(), low=(), close=(), volume=()):
+        self.timestamp = column(timestamp, INT64)
+        self.open = column(open, FLOAT64)
+        self.high = column(high, FLOAT64)
+        self.low = column(low, FLOAT64)
+        self.close = column(close, FLOAT64)
+        self.volume = column(volume, FLOAT64)
+
+    @classmethod
+    def from_rows(cls, rows):
+        columns = [array(typecode) for typecode in cls.typecodes]
+        for row in rows:
+            columns[0].append(int(row[0]))
+            for i in range(1, 6):
+                columns[i].append(NAN if row[i] is None else row[i])
+        return cls(*columns)
+
+    @classmethod
+    def from_trading_view(cls, ohlcvs):
+        t = ohlcvs['t']
+        timestamp = t * 1000 if (get_numpy() is not None) and isinstance(t, numpy.ndarray) else [i * 1000 for i in t]
+        return cls(timestamp, ohlcvs['o'], ohlcvs['h'], ohlcvs['l'], ohlcvs['c'], ohlcvs['v'])
+
+    def to_trading_view(self):
+        """The TradingView t/o/h/l/c/v form, timestamps in seconds, the price and volume columns are shared"""
+        if get_numpy() is not None:
+            t = self.timestamp // 1000
+        else:
+            t = array(INT64, (int(timestamp / 1000) for timestamp in self.timestamp))
+        return {
+            't': t,
+            'o': self.open,
+            'h': self.high,
+            'l': self.low,
+            'c': self.close,
+            'v': self.volume,
+        }
+
+    def columns(self):
+        return [self.timestamp, self.open, self.high, self.low, self.close, self.volume]
+
+    def to_list(self):
+        return list(self)
+
+    def is_sorted(self):
+        t = self.timestamp
+        if get_numpy() is not None:
+            return bool(numpy.all(t[1:] >= t[:-1]))
+        return all(t[i] <= t[i + 1] for i in range(0, len(t) - 1))
+
+    def sort(self):
+        """Returns the candles sorted by timestamp, self if they are sorted already"""
+        if self.is_sorted():
+            return self
+        if get_numpy() is not None:
+            order = numpy.argsort(self.timestamp, kind='mergesort')  # stable
+            return OHLCVColumns(*[values[order] for values in self.columns()])
+        order = sorted(range(0, len(self)), key=self.timestamp.__getitem__)
+        return OHLCVColumns(*[array(values.typecode, (values[i] for i in order)) for values in self.columns()])
+
+    def __len__(self):
+        return len(self.timestamp)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OHLCVColumns(*[values[index] for values in self.columns()])
+        return [
+            int(self.timestamp[index]),
+            float(self.open[index]),
+            float(self.high[index]),
+            float(self.low[index]),
+            float(self.close[index]),
+            float(self.volume[index]),
+        ]
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self[i]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return 'OHLCVColumns(' + repr(self.to_list()) + ')'
+
+
+class OHLCVBuilder(object):
+    """Aggregates trades into the candles of one or more timeframes, one batch of trades after another
+
+    The trades are expected in the order of their timestamps, trades older than the last one seen are
+    ignored. The last candle of each timeframe is the current partial one, it keeps being updated by the
+    next batches until a trade opens the following candle. Batches are aggregated with numpy when it
+    is installed.
+    """
+
+    vectorize = 100  # the smallest batch aggregated with numpy
+
+    def __init__(self, durations):
+        self.durations = durations  # timeframe → milliseconds
+        self.candles = dict((timeframe, []) for timeframe in durations)
+        self.last = None  # the timestamp of the last trade
+
+    def update(self, trades):
+        if self.last is not None:
+            trades = [trade for trade in trades if trade['timestamp'] >= self.last]
+        if not trades:
+            return self
+        self.last = trades[-1]['timestamp']
+        if (get_numpy() is not None) and (len(trades) >= self.vectorize):
+            timestamps = numpy.fromiter((trade['timestamp'] for trade in trades), numpy.int64, len(trades))
+            prices = numpy.fromiter((trade['price'] for trade in trades), numpy.float64, len(trades))
+            amounts = numpy.fromiter((trade['amount'] for trade in trades), numpy.float64, len(trades))
+            for timeframe, ms in self.durations.items():
+                self.merge(self.candles[timeframe], self.aggregate(timestamps, prices, amounts, ms))
+        else:
+            for timeframe, ms in self.durations.items():
+                candles = self.candles[timeframe]
+                for trade in trades:
+                    self.add(candles, trade['timestamp'] // ms * ms, trade['price'], trade['amount'])
+        return self
+
+    @staticmethod
+    def add(candles, opening_time, price, amount):
+        if candles and (candles[-1][0] == opening_time):
+            candle = candles[-1]
+            candle[2] = max(candle[2], price)
+            candle[3] = min(candle[3], price)
+            candle[4] = price
+            candle[5] += amount
+        else:
+            candles.append([opening_time, price, price, price, price, amount])
+
+    @staticmethod
+    def aggregate(timestamps, prices, amounts, ms):
+        opening_times = timestamps // ms * ms
+        starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(opening_times)) + 1))
+        ends = numpy.concatenate((starts[1:], [len(timestamps)])) - 1
+        return numpy.column_stack((
+            opening_times[starts],
+            prices[starts],
+            numpy.maximum.reduceat(prices, starts),
+            numpy.minimum.reduceat(prices, starts),
+            prices[ends],
+            numpy.add.reduceat(amounts, starts),
+        )).tolist()
+
+    @staticmethod
+    def merge(candles, batch):
+        first = batch[0]
+        first[0] = int(first[0])
+        if candles and (candles[-1][0] == first[0]):
+            candle = candles[-1]
+            candle[2] = max(candle[2], first[2])
+            candle[3] = min(candle[3], first[3])
+            candle[4] = first[4]
+            candle[5] += first[5]
+            batch = batch[1:]
+        for candle in batch:
+            candle[0] = int(candle[0])
+            candles.append(candle)
+
+    def ohlcvs(self, timeframe):
+        """All candles of a timeframe, including the current partial one"""
+        return self.candles[timeframe]
+
+    def closed(self, timeframe):
+        """The candles of a timeframe that no later trade can change"""
+        return self.candles[timeframe][0:-1]
+
+    def partial(self, timeframe):
+        """The current candle of a timeframe, None before the first trade"""
+        candles = self.candles[timeframe]
+        return candles[-1] if candles else None
+
+
+class Timeframe(object):
+    """The opening times of the candles of a timeframe
+
+    Weeks, months and years are calendar aligned, weeks start on Monday 00:00 UTC, the rest of the
+    timeframes are multiples of their duration since the epoch.
+    """
+
+    monday = 4 * 24 * 60 * 60 * 1000  # 1970-01-05, the first Monday after the epoch
+
+    def __init__(self, timeframe, seconds):
+        self.timeframe = timeframe
+        self.amount = int(timeframe[0:-1])
+        self.unit = timeframe[-1]
+        self.ms = seconds * 1000
+        if self.unit == 'w':
+            self.ms = self.amount * 7 * 24 * 60 * 60 * 1000
+        self.calendar = self.unit in ('M', 'y')
+        self.months = self.amount * 12 if self.unit == 'y' else self.amount
+
+    def opening_time(self, timestamp):
+        if self.unit == 'w':
+            return (timestamp - self.monday) // self.ms * self.ms + self.monday
+        if not self.calendar:
+            return timestamp // self.ms * self.ms
+        date = time.gmtime(timestamp // 1000)
+        months = (date.tm_year * 12 + date.tm_mon - 1) // self.months * self.months
+        return calendar.timegm((months // 12, months % 12 + 1, 1, 0, 0, 0)) * 1000
+
+    def next_opening_time(self, opening_time):
+        if not self.calendar:
+            return opening_time + self.ms
+        date = time.gmtime(opening_time // 1000)
+        months = date.tm_year * 12 + date.tm_mon - 1 + self.months
+        return calendar.timegm((months // 12, months % 12 + 1, 1, 0, 0, 0)) * 1000
+
+
+def combine(function, a, b):
+    # missing values are None in lists and nan in columns
+    if (a is None) or (a != a):
+        return b
+    if (b is None) or (b != b):
+        return a
+    return function((a, b))
+
+
+def resample_ohlcv(ohlcvs, timeframe, fill_gaps=False):
+    """Aggregates candles into the candles of a coarser Timeframe
+
+    With fill_gaps the missing candles are added with the previous close price and no volume, this also
+    normalizes sparse candles of the same timeframe. OHLCVColumns are resampled into OHLCVColumns.
+    """
+    columns = isinstance(ohlcvs, OHLCVColumns)
+    if columns:
+        ohlcvs = ohlcvs.sort()
+        if (get_numpy() is not None) and len(ohlcvs) and not fill_gaps:
+            return resample_columns(ohlcvs, timeframe)
+    elif any(ohlcvs[i][0] > ohlcvs[i + 1][0] for i in range(0, len(ohlcvs) - 1)):
+        ohlcvs = sorted(ohlcvs, key=lambda ohlcv: ohlcv[0])
+    result = []
+    for ohlcv in ohlcvs:
+        opening_time = timeframe.opening_time(ohlcv[0])
+        if result and (result[-1][0] == opening_time):
+            candle = result[-1]
+            candle[2] = combine(max, candle[2], ohlcv[2])
+            candle[3] = combine(min, candle[3], ohlcv[3])
+            candle[4] = ohlcv[4]
+            candle[5] = combine(sum, candle[5], ohlcv[5])
+            continue
+        if fill_gaps and result:
+            close = result[-1][4]
+            gap = timeframe.next_opening_time(result[-1][0])
+            while gap < opening_time:
+                result.append([gap, close, close, close, close, 0.0])
+                gap = timeframe.next_opening_time(gap)
+        result.append([opening_time, ohlcv[1], ohlcv[2], ohlcv[3], ohlcv[4], ohlcv[5]])
+    return OHLCVColumns.from_rows(result) if columns else result
+
+
+def resample_columns(ohlcvs, timeframe):
+    timestamps = ohlcvs.timestamp
+    if timeframe.calendar:
+        opening_times = numpy.fromiter((timeframe.opening_time(int(timestamp)) for timestamp in timestamps), numpy.int64, len(timestamps))
+    elif timeframe.unit == 'w':
+        opening_times = (timestamps - timeframe.monday) // timeframe.ms * timeframe.ms + timeframe.monday
+    else:
+        opening_times = timestamps // timeframe.ms * timeframe.ms
+    starts = numpy.concatenate(([0], numpy.flatnonzero(numpy.diff(opening_times)) + 1))
+    ends = numpy.concatenate((starts[1:], [len(timestamps)])) - 1
+    volumes = numpy.add.reduceat(numpy.nan_to_num(ohlcvs.volume), starts)
+    volumes[numpy.logical_and.reduceat(numpy.isnan(ohlcvs.volume), starts)] = NAN
+    return OHLCVColumns(
+        opening_times[starts],
+        ohlcvs.open[starts],
+        numpy.fmax.reduceat(ohlcvs.high, starts),  # nan when all of them are nan
+        numpy.fmin.reduceat(ohlcvs.low, starts),
+        ohlcvs.close[ends],
+        volumes,
+    )
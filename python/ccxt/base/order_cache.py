@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+import time
+
+__all__ = [
+    'OrderCache',
+]
+
+
+class OrderCache(OrderedDict):
+    """A dict of cached orders by id, bounded by size and age and indexed by symbol and open status
+
+    Only orders that are not open are evicted, the oldest ones first, from an index of their own.
+    The open index holds the ids of the orders stored with the 'open' status, orders closed by
+    updating them in place are moved from it to the closed index when it is read.
+    """
+
+    def __init__(self, limit=None, max_age=None):
+        self.limit = limit  # orders
+        self.max_age = max_age  # milliseconds
+        self.by_symbol = {}  # symbol → OrderedDict of ids
+        self.open = OrderedDict()  # ids
+        self.closed = OrderedDict()  # ids of the orders that are not open, the oldest first
+        super(OrderCache, self).__init__()
+
+    def __setitem__(self, id, order):
+        if id in self:
+            # an updated order keeps its place in the indexes, like in the dict
+            previous = self[id]
+            if previous.get('symbol') != order.get('symbol'):
+                self.unindex(id, previous)
+        elif self.limit or self.max_age:
+            self.evict(1)
+        super(OrderCache, self).__setitem__(id, order)
+        symbol = order.get('symbol')
+        if symbol not in self.by_symbol:
+            self.by_symbol[symbol] = OrderedDict()
+        self.by_symbol[symbol][id] = True
+        if order.get('status') == 'open':
+            self.closed.pop(id, None)
+            self.open[id] = True
+        else:
+            self.open.pop(id, None)
+            self.closed[id] = True
+
+    def __delitem__(self, id):
+        self.unindex(id, self[id])
+        super(OrderCache, self).__delitem__(id)
+
+    def pop(self, id, *default):
+        if id in self:
+            order = self[id]
+            del self[id]
+            return order
+        return super(OrderCache, self).pop(id, *default)
+
+    def popitem(self, last=True):
+        id = next(reversed(self)) if last else next(iter(self))
+        return id, self.pop(id)
+
+    def clear(self):
+        super(OrderCache, self).clear()
+        self.by_symbol.clear()
+        self.open.clear()
+        self.closed.clear()
+
+    def copy(self):
+        result = OrderCache(self.limit, self.max_age)
+        result.update(self)
+        return result
+
+    def __reduce__(self):
+        return (OrderCache, (self.limit, self.max_age), None, None, iter(self.items()))
+
+    def unindex(self, id, order):
+        ids = self.by_symbol.get(order.get('symbol'))
+        if ids is not None:
+            ids.pop(id, None)
+            if not ids:
+                del self.by_symbol[order.get('symbol')]
+        self.open.pop(id, None)
+        self.closed.pop(id, None)
+
+    def evict(self, room=0):
+        """Drops the oldest orders that are not open until there is room for more and the rest are younger than max_age"""
+        excess = len(self) + room - self.limit if self.limit else 0
+        before = int(time.time() * 1000) - self.max_age if self.max_age else None
+        expired = []
+        # orders are stored roughly in the order of their timestamps, the scan stops at the first young one
+        for id in self.closed:
+            order = self[id]
+            if order.get('status') == 'open':
+                continue  # reopened in place
+            young = (before is None) or ((order.get('timestamp') or 0) >= before)
+            if young and (len(expired) >= excess):
+                break
+            expired.append(id)
+        for id in expired:
+            del self[id]
+
+    def purge(self, before):
+        """Drops all orders that are not open and older than the timestamp before"""
+        expired = [id for id, order in self.items() if (order['status'] != 'open') and (order['timestamp'] < before)]
+        for id in expired:
+            del self[id]
+        return self
+
+    def select(self, symbol=None, status=None):
+        """Returns the cached orders of a symbol and a status, using the indexes instead of a full scan"""
+        if status == 'open':
+            ids = list(self.open.keys())
+        elif symbol is not None:
+            ids = list(self.by_symbol.get(symbol, {}).keys())
+        else:
+            ids = list(self.keys())
+        result = []
+        for id in ids:
+            order = self[id]
+            if (status == 'open') and (order.get('status') != 'open'):
+                del self.open[id]  # closed in place
+                self.closed[id] = True
+            elif ((symbol is None) or (order.get('symbol') == symbol)) and ((status is None) or (order.get('status') == status)):
+                result.append(order)
+        return result
+
+    def reconcile(self, open_orders, symbol=None):
+        """Stores a fresh snapshot of the open orders of a symbol or all symbols,
+        the cached open orders missing from it are marked as closed and returned"""
+        fresh = {}
+        for order in open_orders:
+            id = order['id']
+            self[id] = dict(self[id], **order) if id in self else order
+            fresh[id] = True
+        result = []
+        for order in self.select(symbol, 'open'):
+            if order['id'] not in fresh:
+                # closed or canceled externally, unnoticed by the cache
+                filled = order.get('amount')
+                price = order.get('price')
+                order = dict(order, **{
+                    'status': 'closed',
+                    'cost': filled * price if (filled is not None) and (price is not None) else None,
+                    'filled': filled,
+                    'remaining': 0.0,
+                })
+                self[order['id']] = order
+                result.append(order)
+        return result
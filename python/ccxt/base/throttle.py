@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+try:
+    from time import monotonic as now  # Python 3
+except ImportError:
+    from time import time as now  # Python 2
+
+from time import sleep
+
+__all__ = [
+    'throttle',
+]
+
+
+def throttle(config=None):
+
+    cfg = {
+        'lastTimestamp': None,
+        'numTokens': 0,
+        'lock': threading.Lock(),
+        'refillRate': 0.001,
+        'defaultCost': 1.000,
+        'capacity': 1.000,
+    }
+
+    cfg.update(config or {})
+
+    if cfg['lastTimestamp'] is None:
+        cfg['lastTimestamp'] = now()
+
+    def throttle(cost=None):
+        with cfg['lock']:
+            timestamp = now()
+            elapsed = timestamp - cfg['lastTimestamp']
+            cfg['lastTimestamp'] = timestamp
+            cfg['numTokens'] = min(cfg['capacity'], cfg['numTokens'] + elapsed * cfg['refillRate'] * 1000)
+            # a caller that finds the bucket empty reserves the tokens it will
+            # consume and sleeps outside of the lock until they are refilled,
+            # so concurrent threads are released in the order they arrived
+            delay = 0 if cfg['numTokens'] > 0 else -cfg['numTokens'] / (cfg['refillRate'] * 1000)
+            cfg['numTokens'] -= (cost if cost else cfg['defaultCost'])
+        if delay > 0:
+            sleep(delay)
+
+    return throttle
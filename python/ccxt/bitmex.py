@@ -45,6 +45,11 @@ class bitmex(Exchange):
                 '1h': '1h',
                 '1d': '1d',
             },
+            # the largest pages of the paginated fetch methods, used by the history iterators of the python version
+            'historyPageLimits': {
+                'fetchOHLCV': 500,
+                'fetchLedger': 500,  # since is ignored, the history is a single page
+            },
             'urls': {
                 'test': 'https://testnet.bitmex.com',
                 'logo': 'https://user-images.githubusercontent.com/1294454/27766319-f653c6e6-5ed4-11e7-933d-f0bc3699ae8f.jpg',
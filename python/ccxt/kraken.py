@@ -1293,15 +1293,20 @@ class kraken(Exchange):
         if code == 520:
             raise ExchangeNotAvailable(self.id + ' ' + str(code) + ' ' + reason)
         # todo: rewrite self for "broad" exceptions matching
-        if body.find('Invalid order') >= 0:
+        errors = body
+        if (code < 400) and (response is not None) and (not isinstance(response, basestring)):
+            # only the error list of a successful json reply is scanned
+            messages = self.safe_value(response, 'error', [])
+            errors = ' '.join(messages) if isinstance(messages, list) else str(messages)
+        if errors.find('Invalid order') >= 0:
             raise InvalidOrder(self.id + ' ' + body)
-        if body.find('Invalid nonce') >= 0:
+        if errors.find('Invalid nonce') >= 0:
             raise InvalidNonce(self.id + ' ' + body)
-        if body.find('Insufficient funds') >= 0:
+        if errors.find('Insufficient funds') >= 0:
             raise InsufficientFunds(self.id + ' ' + body)
-        if body.find('Cancel pending') >= 0:
+        if errors.find('Cancel pending') >= 0:
             raise CancelPending(self.id + ' ' + body)
-        if body.find('Invalid arguments:volume') >= 0:
+        if errors.find('Invalid arguments:volume') >= 0:
             raise InvalidOrder(self.id + ' ' + body)
         if body[0] == '{':
             if not isinstance(response, basestring):
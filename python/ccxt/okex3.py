@@ -504,10 +504,13 @@ class okex3(Exchange):
 
     def fetch_markets(self, params={}):
         types = self.safe_value(self.options, 'fetchMarkets')
-        result = []
+        requests = []
         for i in range(0, len(types)):
-            markets = self.fetch_markets_by_type(types[i], params)
-            result = self.array_concat(result, markets)
+            requests.append(self.fetch_markets_by_type(types[i], params))
+        responses = self.gather(requests)
+        result = []
+        for i in range(0, len(responses)):
+            result = self.array_concat(result, responses[i])
         return result
 
     def parse_markets(self, markets):
@@ -18,6 +18,7 @@ class Curve:
         self.openssl_name = openssl_name  # maybe None
         self.curve = curve
         self.generator = generator
+        self.generator.precompute()  # signing multiplies the generator
         self.order = generator.order()
         self.baselen = orderlen(self.order)
         self.verifying_key_length = 2*self.baselen
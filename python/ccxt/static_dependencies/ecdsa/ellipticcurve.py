@@ -29,6 +29,8 @@
 # Revision history:
 #    2005.12.31 - Initial version.
 #    2008.11.25 - Change CurveFp.is_on to contains_point.
+#    ccxt - Multiply points in Jacobian coordinates, with a table of the
+#           doublings of the generators.
 #
 # Written in 2005 by Peter Pearson and placed in the public domain.
 
@@ -71,6 +73,8 @@ class Point(object):
     self.__x = x
     self.__y = y
     self.__order = order
+    self.__precompute = False
+    self.__doublings = None
     # self.curve is allowed to be None only for INFINITY:
     if self.__curve:
       assert self.__curve.contains_point(x, y)
@@ -115,13 +119,6 @@ class Point(object):
   def __mul__(self, other):
     """Multiply a point by an integer."""
 
-    def leftmost_bit(x):
-      assert x > 0
-      result = 1
-      while result <= x:
-        result = 2 * result
-      return result // 2
-
     e = other
     if self.__order:
       e = e % self.__order
@@ -131,23 +128,25 @@ class Point(object):
       return INFINITY
     assert e > 0
 
-    # From X9.62 D.3.2:
-
-    e3 = 3 * e
-    negative_self = Point(self.__curve, self.__x, -self.__y, self.__order)
-    i = leftmost_bit(e3) // 2
-    result = self
-    # print_("Multiplying %s by %d (e3 = %d):" % (self, other, e3))
-    while i > 1:
-      result = result.double()
-      if (e3 & i) != 0 and (e & i) == 0:
-        result = result + self
-      if (e3 & i) == 0 and (e & i) != 0:
-        result = result + negative_self
-      # print_(". . . i = %d, result = %s" % ( i, result ))
-      i = i // 2
+    p = self.__curve.p()
+    a = self.__curve.a()
+    naf = non_adjacent_form(e)
+    result = (0, 1, 0)  # infinity
+    if self.__precompute:
+      # one mixed addition per non-zero digit, no doubling
+      if self.__doublings is None or len(self.__doublings) < len(naf):
+        self.__doublings = doublings(self.__x, self.__y, max(len(naf), bit_length(self.__order) + 1), p, a)
+      for digit, (x, y) in zip(naf, self.__doublings):
+        if digit:
+          result = add_jacobi(result, x, y if digit > 0 else p - y, p, a)
+    else:
+      x, y = self.__x, self.__y
+      for digit in reversed(naf):
+        result = double_jacobi(result, p, a)
+        if digit:
+          result = add_jacobi(result, x, y if digit > 0 else p - y, p, a)
 
-    return result
+    return from_jacobi(self.__curve, result)
 
   def __rmul__(self, other):
     """Multiply a point by an integer."""
@@ -159,6 +158,11 @@ class Point(object):
       return "infinity"
     return "(%d,%d)" % (self.__x, self.__y)
 
+  def precompute(self):
+    """Makes the multiplications of this point use a table of its
+       doublings, built on the first one."""
+    self.__precompute = True
+
   def double(self):
     """Return a new point that is twice the old."""
 
@@ -191,6 +195,91 @@ class Point(object):
     return self.__order
 
 
+def bit_length(x):
+  return len(bin(x)) - 2
+
+
+def non_adjacent_form(e):
+  """The digits -1, 0 and 1 of the NAF of e > 0, least significant first."""
+  digits = []
+  while e:
+    if e & 1:
+      digit = 2 - (e & 3)
+      e -= digit
+    else:
+      digit = 0
+    digits.append(digit)
+    e >>= 1
+  return digits
+
+
+def double_jacobi(point, p, a):
+  """2 * (X, Y, Z), dbl-2007-bl."""
+  X1, Y1, Z1 = point
+  if not Y1 or not Z1:
+    return (0, 1, 0)
+  XX = X1 * X1 % p
+  YY = Y1 * Y1 % p
+  YYYY = YY * YY % p
+  ZZ = Z1 * Z1 % p
+  S = 2 * ((X1 + YY) ** 2 - XX - YYYY) % p
+  M = (3 * XX + a * ZZ * ZZ) % p
+  T = (M * M - 2 * S) % p
+  Y3 = (M * (S - T) - 8 * YYYY) % p
+  Z3 = ((Y1 + Z1) ** 2 - YY - ZZ) % p
+  return (T, Y3, Z3)
+
+
+def add_jacobi(point, x2, y2, p, a):
+  """(X, Y, Z) + (x2, y2) in affine coordinates, madd-2007-bl."""
+  X1, Y1, Z1 = point
+  if not Z1:
+    return (x2, y2, 1)
+  Z1Z1 = Z1 * Z1 % p
+  U2 = x2 * Z1Z1 % p
+  S2 = y2 * Z1 * Z1Z1 % p
+  H = (U2 - X1) % p
+  r = 2 * (S2 - Y1) % p
+  if not H:
+    if not r:
+      return double_jacobi(point, p, a)
+    return (0, 1, 0)
+  HH = H * H % p
+  I = 4 * HH % p
+  J = H * I % p
+  V = X1 * I % p
+  X3 = (r * r - J - 2 * V) % p
+  Y3 = (r * (V - X3) - 2 * Y1 * J) % p
+  Z3 = ((Z1 + H) ** 2 - Z1Z1 - HH) % p
+  return (X3, Y3, Z3)
+
+
+def to_affine(point, p):
+  X, Y, Z = point
+  z = numbertheory.inverse_mod(Z, p)
+  zz = z * z % p
+  return X * zz % p, Y * zz * z % p
+
+
+def from_jacobi(curve, point):
+  if not point[2]:
+    return INFINITY
+  x, y = to_affine(point, curve.p())
+  return Point(curve, x, y)
+
+
+def doublings(x, y, count, p, a):
+  """The affine coordinates of 2**i * (x, y) for i < count."""
+  result = [(x, y)]
+  point = (x, y, 1)
+  while len(result) < count:
+    point = double_jacobi(point, p, a)
+    if not point[2]:
+      break
+    result.append(to_affine(point, p))
+  return result
+
+
 # This one point is the Point At Infinity for all purposes:
 INFINITY = Point(None, None, None)
 
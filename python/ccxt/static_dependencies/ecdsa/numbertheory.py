@@ -202,6 +202,11 @@ def inverse_mod(a, m):
   if a < 0 or m <= a:
     a = a % m
 
+  try:
+    return pow(a, -1, m)  # python 3.8+
+  except (TypeError, ValueError):  # before python 3.8, or without an inverse
+    pass
+
   # From Ferguson and Schneier, roughly:
 
   c, d = a, m
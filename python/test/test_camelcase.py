@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class binance_subclass(ccxt.binance):
+
+    def fetch_something_new(self):
+        return 'new'
+
+
+# the first instance defines the aliases of the class, the next ones reuse them
+first = ccxt.binance()
+second = ccxt.binance({'markets_cache_ttl': 5})
+assert('_camelcase_properties' in ccxt.binance.__dict__)
+assert(second.fetchTicker.__func__ is first.fetchTicker.__func__ is ccxt.binance.fetch_ticker)
+assert(second.publicGetDepth.__func__ is ccxt.binance.public_get_depth)
+assert(first.marketsCacheTtl == 3600000 and second.marketsCacheTtl == 5)
+assert(second.requestsAdapterOptions is second.requests_adapter_options)
+
+# a subclass gets an alias set of its own, the methods it adds are not aliased on its parent
+subclass = binance_subclass()
+assert('_camelcase_properties' in binance_subclass.__dict__)
+assert(subclass.fetchSomethingNew() == 'new' and subclass.fetchTicker.__func__ is ccxt.binance.fetch_ticker)
+assert(not hasattr(ccxt.binance, 'fetchSomethingNew') and not hasattr(ccxt.binance(), 'fetchSomethingNew'))
+
+# an api from config defines its methods even when the class has been set up already
+custom = ccxt.binance({'api': {'public': {'get': {'custom/path': 3}}}})
+assert(custom.publicGetCustomPath.__func__ is custom.public_get_custom_path.__func__)
+assert(custom.publicGetCustomPath.__name__ == 'request')
+assert(custom.calculate_rate_limiter_cost('public', 'GET', 'custom/path', {}) == 3)
+# and keeps the weights declared by the class
+assert(ccxt.binance().calculate_rate_limiter_cost('private', 'GET', 'allOrders', {}) == 5)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+async def test_shared_connectors():
+    options = {'limit': 10, 'local_addr': ['127.0.0.1', 0]}  # a list is not hashable
+    first = Exchange({'aiohttp_shared_connector': True, 'aiohttp_connector_options': options})
+    second = Exchange({'aiohttp_shared_connector': True, 'aiohttp_connector_options': {'local_addr': ['127.0.0.1', 0], 'limit': 10}})
+    other = Exchange({'aiohttp_shared_connector': True, 'aiohttp_connector_options': {'limit': 20}})
+    private = Exchange({'aiohttp_connector_options': options})
+    for exchange in (first, second, other, private):
+        exchange.open()
+
+    # equal options share one connector regardless of their order, different options do not
+    assert(first.session.connector is second.session.connector)
+    assert(first.session.connector is not other.session.connector)
+    assert(private.session.connector is not first.session.connector)
+    assert(len(Exchange.connectors) == 2)
+
+    # building the ssl context once per CA file
+    assert(first.ssl_context() is other.ssl_context() is private.ssl_context())
+    assert(Exchange({'verify': False}).ssl_context() is False)
+
+    # closing an instance closes its own connector but not the shared one
+    connector = first.session.connector
+    own = private.session.connector
+    await first.close()
+    await private.close()
+    assert(own.closed and not connector.closed)
+    assert(second.session.connector is connector)
+
+    # a shared connector closed by hand is replaced on the next session
+    await second.close()
+    await connector.close()
+    first.open()
+    assert(first.session.connector is not connector and not first.session.connector.closed)
+    await first.close()
+    await other.close()
+    await Exchange.close_shared_connectors()
+    assert(Exchange.connectors == {})
+
+
+asyncio.get_event_loop().run_until_complete(test_shared_connectors())
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+privateKey = '1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a'
+requests = [
+    ('1a', 'sha256', False),
+    (privateKey, None, False),
+    ('2b' * 100, 'sha256', True),
+    ('c0ffee', 'sha256', True),
+]
+
+# the native backends and the vendored ecdsa produce the same signatures
+for algorithm in ['p256', 'secp256k1']:
+    assert(Exchange.ecdsa_multiplier(algorithm) is not None)
+    for request, hash, fixed_length in requests:
+        native = Exchange.ecdsa(request, privateKey, algorithm, hash, fixed_length)
+        Exchange.ecdsa_multipliers[algorithm] = None
+        vendored = Exchange.ecdsa(request, privateKey, algorithm, hash, fixed_length)
+        del Exchange.ecdsa_multipliers[algorithm]
+        assert(native == vendored)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class parser(Exchange):
+
+    def parse_trade(self, trade, market=None):
+        return {'id': trade['id'], 'symbol': 'BTC/USD', 'timestamp': trade['time'], 'info': trade}
+
+    def parse_order(self, order, market=None):
+        return {'id': order['id'], 'symbol': 'BTC/USD', 'timestamp': order['time'], 'status': 'open', 'info': order}
+
+
+response = [{'id': '1', 'time': 2}, {'id': '2', 'time': 1}]
+
+# the parsed structures keep the raw response by default
+exchange = parser()
+trades = exchange.parse_trades(response)
+assert([trade['id'] for trade in trades] == ['2', '1'])
+assert(trades[0]['info'] is response[1])
+assert(exchange.parse_orders(response)[1]['info'] is response[0])
+
+# and drop it with enableInfo disabled, along with the params extending them
+exchange = parser({'enableInfo': False})
+trades = exchange.parse_trades(response, None, None, None, {'type': 'limit'})
+assert([trade['id'] for trade in trades] == ['2', '1'])
+assert(all(trade['info'] is None and trade['type'] == 'limit' for trade in trades))
+orders = exchange.parse_orders(response, None, 2)
+assert([order['id'] for order in orders] == ['1'])
+assert(orders[0]['info'] is None and orders[0]['status'] == 'open')
+
+# tickers are filtered through the base class, which drops the info as well
+binance = ccxt.binance({'enableInfo': False})
+binance.set_markets([{'id': 'BTCUSDT', 'symbol': 'BTC/USDT', 'base': 'BTC', 'quote': 'USDT'}])
+raw_tickers = [{'symbol': 'BTCUSDT', 'lastPrice': '10000', 'closeTime': 1}]
+tickers = binance.parse_tickers(raw_tickers, ['BTC/USDT'])
+assert(tickers['BTC/USDT']['last'] == 10000 and tickers['BTC/USDT']['info'] is None)
+binance.enableInfo = True
+assert(binance.parse_tickers(raw_tickers, ['BTC/USDT'])['BTC/USDT']['info'] is raw_tickers[0])
+# raw responses without an info pass through unchanged
+assert(exchange.filter_by_array(response, 'id', None, False) == response)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+active = []
+overlap = []
+
+
+async def request(result):
+    # counts the requests awaited at the same time
+    active.append(result)
+    overlap.append(len(active))
+    await asyncio.sleep(0.01)
+    active.remove(result)
+    return result
+
+
+class fees(ccxt.async_support.Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(fees, self).describe(), {
+            'id': 'fees',
+            'has': {
+                'fetchTradingFees': True,
+                'fetchFundingFees': True,
+            },
+        })
+
+    async def fetch_trading_fees(self, params={}):
+        return await request({'maker': 0.001})
+
+    async def fetch_funding_fees(self, params={}):
+        return await request({'withdraw': {}})
+
+
+class okex3(ccxt.async_support.okex3):
+
+    async def fetch_markets_by_type(self, type, params={}):
+        return await request([{'type': type}])
+
+
+class sync_okex3(ccxt.okex3):
+
+    def fetch_markets_by_type(self, type, params={}):
+        return [{'type': type}]
+
+
+async def test_gather():
+    # the trading and funding fees are requested concurrently
+    exchange = fees()
+    assert(await exchange.fetch_fees() == {'trading': {'maker': 0.001}, 'funding': {'withdraw': {}}})
+    assert(max(overlap) == 2)
+    await exchange.close()
+
+    # the markets of all types are requested concurrently and concatenated in the order of the types
+    del overlap[:]
+    exchange = okex3()
+    types = exchange.options['fetchMarkets']
+    assert(len(types) > 1)
+    markets = await exchange.fetch_markets()
+    assert([market['type'] for market in markets] == types)
+    assert(max(overlap) == len(types))
+    await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test_gather())
+
+# the sync counterpart returns the results of the requests made one by one
+exchange = sync_okex3()
+assert([market['type'] for market in exchange.fetch_markets()] == exchange.options['fetchMarkets'])
+assert(exchange.gather(iter([1, 2])) == [1, 2])
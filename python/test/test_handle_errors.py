@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.errors import DDoSProtection, ExchangeError, InsufficientFunds  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def handle_errors(exchange, code, response):
+    body = json.dumps(response)
+    return exchange.handle_errors(code, 'OK', 'https://api.example.com', 'GET', {}, body, response, {}, None)
+
+
+def raises(exception, exchange, code, response):
+    try:
+        handle_errors(exchange, code, response)
+    except exception:
+        return True
+    return False
+
+
+kraken = ccxt.kraken()
+
+# successful responses pass, even when their entries read like errors
+success = {'error': [], 'result': {'trades': [{'descr': 'Invalid order Insufficient funds'}] * 100}}
+assert(handle_errors(kraken, 200, success) is None)
+
+# the listed errors are raised
+assert(raises(InsufficientFunds, kraken, 200, {'error': ['EOrder:Insufficient funds'], 'result': {}}))
+assert(raises(DDoSProtection, kraken, 200, {'error': ['EAPI:Rate limit exceeded']}))
+assert(raises(ExchangeError, kraken, 200, {'error': ['EGeneral:Unknown']}))
+
+# the whole body is scanned when it is not json
+try:
+    kraken.handle_errors(200, 'OK', 'https://api.example.com', 'GET', {}, 'Insufficient funds', None, {}, None)
+    assert(False)
+except InsufficientFunds:
+    pass
+
+exx = ccxt.exx()
+assert(handle_errors(exx, 200, {'result': True, 'data': [1] * 100}) is None)
+assert(handle_errors(exx, 200, [{'price': 1}]) is None)
+assert(handle_errors(exx, 200, {'code': '100', 'message': 'success'}) is None)
+assert(raises(ExchangeError, exx, 200, {'result': False, 'message': 'error'}))
+assert(raises(ExchangeError, exx, 200, {'code': '101', 'message': 'error'}))
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+minute = 60000
+candles = [[i * minute, 1.0, 2.0, 0.5, 1.5, 10.0] for i in range(0, 25)]
+# trades 3 and 4 share a timestamp and end up on different pages
+trades = [{'id': str(i), 'timestamp': 1000 * (i if i != 4 else 3)} for i in range(0, 12)]
+
+
+class history(Exchange):
+
+    requests = []
+
+    def fetch_ohlcv(self, symbol, timeframe='1m', since=None, limit=None, params={}):
+        self.requests.append(since)
+        return [candle for candle in candles if since is None or candle[0] >= since][0:limit or 10]
+
+    def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        self.requests.append(since)
+        return [trade for trade in trades if since is None or trade['timestamp'] >= since][0:4]
+
+    def fetch_ledger(self, code=None, since=None, limit=None, params={}):
+        self.requests.append(since)
+        return trades[-3:]  # ignores since
+
+
+class async_history(AsyncExchange):
+
+    requests = []
+
+    async def fetch_trades(self, symbol, since=None, limit=None, params={}):
+        self.requests.append(since)
+        await asyncio.sleep(0.001)
+        return history.fetch_trades(self, symbol, since, limit, params)
+
+
+exchange = history()
+assert(list(exchange.iter_ohlcv('BTC/USD', '1m', 0)) == candles)
+assert(exchange.requests == [0, 10 * minute, 20 * minute, 25 * minute])
+
+# until is exclusive
+exchange.requests = []
+assert(list(exchange.iter_ohlcv('BTC/USD', '1m', 3 * minute, 13 * minute, 5)) == candles[3:13])
+assert(exchange.requests == [3 * minute, 8 * minute])
+
+# the page limits declared by the exchange are requested unless a limit is passed
+exchange = history({'historyPageLimits': {'fetchOHLCV': 20}})
+exchange.requests = []
+assert(list(exchange.iter_ohlcv('BTC/USD', '1m', 0)) == candles)
+assert(exchange.requests == [0, 20 * minute, 25 * minute])
+assert(ccxt.binance().historyPageLimits['fetchOHLCV'] == 500)
+assert(ccxt.bitmex().historyPageLimits['fetchLedger'] == 500)
+
+# overlapping pages are deduplicated, entries sharing the boundary timestamp are not lost
+assert([trade['id'] for trade in exchange.iter_trades('BTC/USD', 0)] == [str(i) for i in range(0, 12)])
+
+# exchanges ignoring since stop after one page without anything new
+exchange.requests = []
+assert(len(list(exchange.iter_ledger(None, 0))) == 3)
+assert(len(exchange.requests) == 3)
+
+
+async def test_async_history():
+    exchange = async_history()
+    result = []
+    async for trade in exchange.iter_trades('BTC/USD', 0):
+        result.append(trade['id'])
+        if trade['id'] == '1':
+            # the second page is requested while the first one is consumed
+            assert(len(exchange.requests) == 2)
+    assert(result == [str(i) for i in range(0, 12)])
+    # stopping early cancels the request of the next page
+    iterator = exchange.iter_trades('BTC/USD', 0)
+    await iterator.__anext__()
+    next_page = iterator.next_page
+    await iterator.aclose()
+    assert(next_page.cancelled())
+    async with exchange.iter_trades('BTC/USD', 0) as iterator:
+        async for trade in iterator:
+            next_page = iterator.next_page
+            break
+    assert(next_page.cancelled() and iterator.next_page is None)
+    iterator = exchange.iter_trades('BTC/USD', 0)
+    await iterator.__anext__()
+    next_page = iterator.next_page
+    del iterator
+    await asyncio.sleep(0)
+    assert(next_page.cancelled())
+    await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test_async_history())
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base import exchange as exchange_module  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.errors import NotSupported  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# without the optional decoders installed 'auto' falls back to the stdlib and the others are not supported
+installed = dict(exchange_module.json_decoders)
+exchange_module.json_decoders.clear()
+exchange_module.json_decoders['json'] = json.loads
+try:
+    assert(Exchange.select_json_decoder('auto') is json.loads)
+    assert(Exchange.select_json_decoder() is json.loads)
+    for name in ['orjson', 'ujson', 'simdjson']:
+        try:
+            Exchange.select_json_decoder(name)
+            assert(False)
+        except NotSupported:
+            pass
+    assert(Exchange({'json_decoder': 'auto'}).json_loads is json.loads)
+finally:
+    exchange_module.json_decoders.clear()
+    exchange_module.json_decoders.update(installed)
+
+
+# a callable is used as is, the stdlib decodes what it rejects
+def strict(text):
+    if 'NaN' in text:
+        raise ValueError('NaN is not valid json')
+    return {'strict': True}
+
+
+exchange = Exchange({'json_decoder': strict})
+assert(exchange.json_loads is strict)
+assert(exchange.parse_json('{"price": 1}') == {'strict': True})
+decoded = exchange.parse_json('{"price": NaN}')
+assert(decoded['price'] != decoded['price'])
+assert(exchange.parse_json('not json') is None)
+
+# the stdlib decoder raises and the response is not json
+exchange = Exchange()
+assert(exchange.parse_json('{"price": 1') is None)
+assert(exchange.parse_json('[1, 2]') == [1, 2])
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+import os
+import pickle
+import socket
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange, KeepAliveHTTPAdapter  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# both schemes are mounted with the keep-alive adapter sized by requests_adapter_options
+exchange = Exchange({'requests_adapter_options': {'pool_connections': 4, 'pool_maxsize': 16, 'pool_block': True}})
+adapter = exchange.session.get_adapter('https://api.example.com')
+assert(isinstance(adapter, KeepAliveHTTPAdapter))
+assert(exchange.session.get_adapter('http://api.example.com') is adapter)
+assert(adapter.poolmanager.connection_pool_kw['maxsize'] == 16)
+assert(adapter.poolmanager.connection_pool_kw['block'] is True)
+assert(adapter.poolmanager.pools._maxsize == 4)
+
+# the pooled connections get TCP_NODELAY and SO_KEEPALIVE by default
+socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+assert((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options)
+assert((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options)
+
+# custom socket options replace the default ones and survive pickling
+custom = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+adapter = Exchange({'requests_adapter_options': {'socket_options': custom}}).session.get_adapter('https://api.example.com')
+assert(adapter.poolmanager.connection_pool_kw['socket_options'] == custom)
+adapter = pickle.loads(pickle.dumps(adapter))
+assert(adapter.poolmanager.connection_pool_kw['socket_options'] == custom)
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+import ccxt.async_support  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+# the optional dependencies of the columnar candles are imported on first use
+assert('numpy' not in sys.modules)
+
+for package in [ccxt, ccxt.async_support]:
+    prefix = package.__name__ + '.'
+
+    # the exchanges are listed without importing their modules
+    assert('kraken' in package.exchanges and 'binanceus' in package.exchanges)
+    assert('kraken' in dir(package) and 'Exchange' in dir(package))
+    assert(prefix + 'kraken' not in sys.modules)
+    assert(prefix + 'bitstamp' not in sys.modules)
+
+    # an exchange is imported on first access
+    bitstamp = getattr(package, 'bitstamp')
+    assert(prefix + 'bitstamp' in sys.modules)
+    assert(isinstance(bitstamp, type) and issubclass(bitstamp, package.Exchange))
+    assert(getattr(package, 'bitstamp') is bitstamp)
+
+    try:
+        getattr(package, 'notanexchange')
+        assert(False)
+    except AttributeError:
+        pass
+
+# importing a submodule first binds the exchange class onto the package, not the module
+import ccxt.kraken  # noqa: E402
+from ccxt.binanceus import binanceus  # noqa: E402
+import ccxt.async_support.kraken  # noqa: E402
+from ccxt.async_support.binanceus import binanceus as async_binanceus  # noqa: E402
+
+for package, derived in [(ccxt, binanceus), (ccxt.async_support, async_binanceus)]:
+    for id in ['kraken', 'binanceus', 'binance']:
+        exchange = getattr(package, id)
+        assert(isinstance(exchange, type) and issubclass(exchange, package.Exchange))
+        assert(exchange().id == id)
+    assert(getattr(package, 'binanceus') is derived)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange as AsyncExchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+calls = []
+
+
+def markets():
+    calls.append(time.time())
+    return [{
+        'id': 'btcusd',
+        'symbol': 'BTC/USD',
+        'base': 'BTC',
+        'quote': 'USD',
+        'info': {'pair': 'btcusd'},
+    }]
+
+
+class cached(Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(cached, self).describe(), {
+            'id': 'cached',
+            'urls': {
+                'api': 'https://api.example.com',
+                'test': 'https://sandbox.example.com',
+            },
+        })
+
+    def fetch_markets(self, params={}):
+        return markets()
+
+
+class async_cached(AsyncExchange):
+
+    delay = 0
+
+    def describe(self):
+        return self.deep_extend(super(async_cached, self).describe(), {
+            'id': 'cached',
+            'urls': {
+                'api': 'https://api.example.com',
+            },
+        })
+
+    async def fetch_markets(self, params={}):
+        await asyncio.sleep(self.delay)
+        return markets()
+
+
+directory = tempfile.mkdtemp()
+
+try:
+    # the first instance fetches the markets, the next ones read them from the cache
+    exchange = cached({'markets_cache_dir': directory})
+    assert(exchange.load_markets()['BTC/USD']['id'] == 'btcusd')
+    assert(len(calls) == 1)
+    assert(os.path.exists(os.path.join(directory, 'cached.json')))
+    exchange = cached({'markets_cache_dir': directory})
+    assert(exchange.load_markets()['BTC/USD']['info'] == {'pair': 'btcusd'})
+    assert(exchange.markets_by_id['btcusd']['symbol'] == 'BTC/USD')
+    assert(len(calls) == 1)
+
+    # sandbox markets are cached separately
+    exchange = cached({'markets_cache_dir': directory})
+    exchange.set_sandbox_mode(True)
+    exchange.load_markets()
+    assert(len(calls) == 2)
+    assert(os.path.exists(os.path.join(directory, 'cached-sandbox.json')))
+
+    # stale markets are served immediately and reloaded in the background
+    exchange = cached({'markets_cache_dir': directory, 'markets_cache_ttl': 0})
+    time.sleep(0.01)
+    stale = exchange.load_markets()
+    assert(stale['BTC/USD']['id'] == 'btcusd')
+    exchange._markets_cache_refresh.join()
+    assert(len(calls) == 3)
+    # the reload swaps in new tables instead of updating the ones in use
+    assert(exchange.markets is not stale and exchange.markets_by_id['btcusd'] is exchange.markets['BTC/USD'])
+
+    # the markets loaded by one instance are attached to the others without copies or requests
+    shared = cached()
+    shared.share_markets_from(exchange)
+    assert(shared.load_markets() is exchange.markets)
+    assert(shared.currencies_by_id is exchange.currencies_by_id)
+    assert(len(calls) == 3)
+
+    # async instances share the same cache
+    async def test_async_markets_cache():
+        exchange = async_cached({'markets_cache_dir': directory})
+        await exchange.load_markets()
+        assert(len(calls) == 3)
+        exchange = async_cached({'markets_cache_dir': directory, 'markets_cache_ttl': 0})
+        await exchange.load_markets()
+        while exchange._markets_cache_refresh:
+            await asyncio.sleep(0.001)
+        assert(len(calls) == 4)
+        await exchange.close()
+        # concurrent calls on a cold instance share a single request
+        exchange = async_cached()
+        results = await asyncio.gather(*[exchange.load_markets() for i in range(10)])
+        assert(len(calls) == 5)
+        assert(all(result is results[0] for result in results))
+        await exchange.close()
+        # closing the instance cancels the background reload along with the shielded request it waits for
+        exchange = async_cached({'markets_cache_dir': directory, 'markets_cache_ttl': 0, 'delay': 10})
+        await exchange.load_markets()
+        await asyncio.sleep(0.01)
+        in_flight = list(exchange._in_flight.values())
+        assert(len(in_flight) == 1)
+        await exchange.close()
+        assert(in_flight[0].cancelled())
+        assert(exchange._in_flight == {} and exchange._markets_cache_refresh is None)
+        assert(len(calls) == 5)
+
+    asyncio.get_event_loop().run_until_complete(test_async_markets_cache())
+finally:
+    shutil.rmtree(directory)
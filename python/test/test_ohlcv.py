@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.ohlcv import OHLCVColumns  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+rows = [
+    [3000, 1.0, 4.0, 0.5, 2.0, 10.0],
+    [1000, 2.0, 3.0, 1.0, 2.5, 20.0],
+    [2000, 2.5, 2.5, 2.0, 2.0, 30.0],
+]
+
+exchange = Exchange()
+assert(exchange.parse_ohlcvs(rows, None, '1s', 2000) == [rows[2], rows[0]])
+assert(exchange.parse_ohlcvs(rows, None, '1s', None, 2) == [rows[1], rows[0]])
+
+# columnar candles are sorted, filtered and limited like the lists
+exchange = Exchange({'ohlcv_columns': True})
+ohlcvs = exchange.parse_ohlcvs(rows)
+assert(isinstance(ohlcvs, OHLCVColumns))
+assert(len(ohlcvs) == 3)
+assert(ohlcvs.to_list() == [rows[1], rows[2], rows[0]])
+assert(list(ohlcvs.timestamp) == [1000, 2000, 3000])
+assert(ohlcvs[-1] == rows[0])
+assert(ohlcvs[1:] == [rows[2], rows[0]])
+assert(exchange.parse_ohlcvs(rows, None, '1s', 2000) == [rows[2], rows[0]])
+assert(exchange.parse_ohlcvs(rows, None, '1s', None, 2) == [rows[1], rows[0]])
+
+# the tradingview form shares the price and volume columns
+tradingview = exchange.convert_ohlcv_to_trading_view(ohlcvs)
+assert(list(tradingview['t']) == [1, 2, 3])
+assert(tradingview['c'] is ohlcvs.close)
+assert(OHLCVColumns.from_trading_view(tradingview) == ohlcvs)
+assert(exchange.convert_trading_view_to_ohlcv(tradingview) == ohlcvs.to_list())
+
+# candles built from trades include the last trade
+trades = [{'timestamp': i * 20000, 'price': 1.0 + i, 'amount': 1.0} for i in range(0, 7)]
+assert(exchange.build_ohlcv(trades, '1m') == [
+    [0, 1.0, 3.0, 1.0, 3.0, 3.0],
+    [60000, 4.0, 6.0, 4.0, 6.0, 3.0],
+    [120000, 7.0, 7.0, 7.0, 7.0, 1.0],
+])
+assert(exchange.build_ohlcv(trades, '1m', 40000, 4) == [
+    [0, 3.0, 3.0, 3.0, 3.0, 1.0],
+    [60000, 4.0, 4.0, 4.0, 4.0, 1.0],
+])
+
+# batches update the current partial candle of every timeframe
+for vectorize in [100, 1]:
+    builder = exchange.ohlcv_builder(['1m', '2m'])
+    builder.vectorize = vectorize
+    builder.update(trades[0:4]).update(trades[1:2] + trades[4:7])  # older trades are ignored
+    assert(builder.ohlcvs('1m') == exchange.build_ohlcv(trades, '1m'))
+    assert(builder.ohlcvs('2m') == [[0, 1.0, 6.0, 1.0, 6.0, 6.0], [120000, 7.0, 7.0, 7.0, 7.0, 1.0]])
+    assert(builder.closed('2m') == [[0, 1.0, 6.0, 1.0, 6.0, 6.0]])
+    assert(builder.partial('2m') == [120000, 7.0, 7.0, 7.0, 7.0, 1.0])
+
+# resampling into coarser timeframes
+day = 24 * 60 * 60 * 1000
+candles = [
+    [0, 1.0, 2.0, 0.5, 1.5, 10.0],
+    [60000, 1.5, 3.0, 1.0, 2.0, None],
+    [180000, 2.0, 2.5, 1.5, 2.5, 5.0],
+]
+assert(exchange.resample_ohlcv(candles, '2m') == [
+    [0, 1.0, 3.0, 0.5, 2.0, 10.0],
+    [120000, 2.0, 2.5, 1.5, 2.5, 5.0],
+])
+# gaps are filled with the previous close
+assert(exchange.resample_ohlcv(candles, '1m', True)[2] == [120000, 2.0, 2.0, 2.0, 2.0, 0.0])
+assert(len(exchange.resample_ohlcv(candles, '1m', True)) == 4)
+# weeks start on monday, months on the first day of the calendar month
+assert(exchange.resample_ohlcv([[exchange.parse8601('2019-11-14T10:00:00Z')] + candles[0][1:]], '1w')[0][0] == exchange.parse8601('2019-11-11T00:00:00Z'))
+monthly = exchange.resample_ohlcv([[exchange.parse8601('2019-02-28T10:00:00Z')] + candles[0][1:], [exchange.parse8601('2019-03-01T10:00:00Z')] + candles[2][1:]], '1M', True)
+assert([candle[0] for candle in monthly] == [exchange.parse8601('2019-02-01T00:00:00Z'), exchange.parse8601('2019-03-01T00:00:00Z')])
+yearly = exchange.resample_ohlcv([[exchange.parse8601('2019-02-28T10:00:00Z')] + candles[0][1:], [exchange.parse8601('2021-03-01T10:00:00Z')] + candles[2][1:]], '1y', True)
+assert([exchange.iso8601(candle[0]) for candle in yearly] == ['2019-01-01T00:00:00.000Z', '2020-01-01T00:00:00.000Z', '2021-01-01T00:00:00.000Z'])
+# columns are resampled into columns
+resampled = exchange.resample_ohlcv(OHLCVColumns.from_rows(candles + [[day, 1.0, 1.0, 1.0, 1.0, 1.0]]), '1d')
+assert(isinstance(resampled, OHLCVColumns))
+assert(resampled.to_list() == [[0, 1.0, 3.0, 0.5, 2.5, 15.0], [day, 1.0, 1.0, 1.0, 1.0, 1.0]])
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import pickle
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+import ccxt  # noqa: E402
+from ccxt.base.order_cache import OrderCache  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def order(id, symbol='BTC/USD', status='open', timestamp=1000):
+    return {
+        'id': id,
+        'symbol': symbol,
+        'status': status,
+        'timestamp': timestamp,
+        'amount': 2.0,
+        'price': 10.0,
+    }
+
+
+# the cache is bounded, only the oldest orders that are not open are evicted
+orders = OrderCache(limit=3)
+orders['1'] = order('1', status='closed')
+orders['2'] = order('2')
+orders['3'] = order('3', status='canceled')
+orders['4'] = order('4', 'ETH/USD')
+assert(list(orders.keys()) == ['2', '3', '4'])
+orders['5'] = order('5')
+assert(list(orders.keys()) == ['2', '4', '5'])
+
+# indexed by symbol and open status, orders closed in place leave the open index when it is read
+assert([o['id'] for o in orders.select('ETH/USD')] == ['4'])
+orders['2']['status'] = 'canceled'
+assert([o['id'] for o in orders.select(status='open')] == ['4', '5'])
+assert([o['id'] for o in orders.select('BTC/USD', 'open')] == ['5'])
+assert(list(orders.open.keys()) == ['4', '5'])
+assert(list(orders.closed.keys()) == ['2'])
+
+# the orders that are not open are evicted from an index of their own, without scanning the open ones
+many = OrderCache(limit=1001)
+for i in range(1000):
+    many[str(i)] = order(str(i))
+for i in range(1000, 1100):
+    many[str(i)] = order(str(i), status='closed')
+assert(len(many) == 1001 and len(many.open) == 1000)
+assert(list(many.closed.keys()) == ['1099'])
+many['0'] = order('0', status='closed')
+assert(list(many.closed.keys()) == ['1099', '0'] and '0' not in many.open)
+many['1100'] = order('1100')
+assert(list(many.closed.keys()) == ['0'] and '1099' not in many)
+
+# open orders of the symbol missing from a fresh snapshot are closed
+closed = orders.reconcile([order('6')], 'BTC/USD')
+assert([o['id'] for o in closed] == ['5'])
+assert(orders['5']['status'] == 'closed')
+assert(orders['5']['filled'] == 2.0)
+assert(orders['5']['remaining'] == 0.0)
+assert(orders['5']['cost'] == 20.0)
+assert(orders['4']['status'] == 'open')
+assert(orders['6']['status'] == 'open')
+
+# purging keeps the open orders and the recent ones
+orders['7'] = order('7', status='closed', timestamp=3000)
+orders.purge(2000)
+assert(sorted(orders.keys()) == ['4', '6', '7'])
+
+# copies keep the settings and the indexes
+for clone in [orders.copy(), copy.deepcopy(orders), pickle.loads(pickle.dumps(orders))]:
+    assert(clone.limit == 3)
+    assert(clone == orders)
+    assert(sorted(clone.open.keys()) == ['4', '6'])
+    assert(list(clone.closed.keys()) == ['7'])
+
+# exchange instances cache their orders in a bounded OrderCache
+exchange = Exchange({'orders_cache_limit': 100})
+assert(isinstance(exchange.orders, OrderCache))
+assert(exchange.orders.limit == 100)
+exchange.orders['1'] = order('1')
+assert(exchange.to_array(exchange.orders) == [order('1')])
+assert(exchange.purge_cached_orders(2000) is exchange.orders)
+
+# the emulated order histories reconcile their snapshots of open orders through the base helpers
+exchange.orders.clear()
+exchange.orders['1'] = order('1')
+exchange.orders['2'] = order('2', 'ETH/USD')
+assert([o['id'] for o in exchange.reconcile_cached_orders([order('3')], 'BTC/USD')] == ['1', '3'])
+assert(exchange.orders['1']['status'] == 'closed' and exchange.orders['2']['status'] == 'open')
+assert([o['id'] for o in exchange.select_cached_orders('BTC/USD', 'open')] == ['3'])
+assert([o['id'] for o in exchange.select_cached_orders(status='closed')] == ['1'])
+
+
+class exmo(ccxt.exmo):
+
+    open_orders = []
+
+    def fetch2(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'BTC_USD': self.open_orders}
+
+
+exchange = exmo()
+exchange.set_markets([{'id': 'BTC_USD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}])
+exchange.open_orders = [
+    {'order_id': '1', 'created': '1435517311', 'type': 'buy', 'pair': 'BTC_USD', 'price': '100', 'quantity': '1', 'amount': '100'},
+    {'order_id': '2', 'created': '1435517312', 'type': 'sell', 'pair': 'BTC_USD', 'price': '200', 'quantity': '2', 'amount': '400'},
+]
+assert([o['id'] for o in exchange.fetch_open_orders('BTC/USD')] == ['1', '2'])
+exchange.open_orders = exchange.open_orders[1:]
+assert([o['id'] for o in exchange.fetch_open_orders('BTC/USD')] == ['2'])
+closed = exchange.fetch_closed_orders('BTC/USD')
+assert([o['id'] for o in closed] == ['1'])
+assert(closed[0]['filled'] == 1.0 and closed[0]['cost'] == 100.0)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.decimal_to_precision import precision_formatter  # noqa: E402
+from ccxt.base.decimal_to_precision import TRUNCATE, ROUND, DECIMAL_PLACES, TICK_SIZE, NO_PADDING  # noqa: E402
+from ccxt.base.exchange import Exchange  # noqa: E402
+from ccxt.base.errors import ExchangeError  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+def decimal_to_precision(n, rounding_mode=ROUND, precision=None, counting_mode=DECIMAL_PLACES, padding_mode=NO_PADDING):
+    return precision_formatter(rounding_mode, precision, counting_mode, padding_mode)(n)
+
+
+# the formatters pass all the test vectors of decimal_to_precision
+vectors = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test_decimal_to_precision.py')
+with open(vectors) as f:
+    source = f.read().replace("import decimal_to_precision ", "import number_to_string ")
+exec(compile(source, vectors, 'exec'), {'__file__': vectors, 'decimal_to_precision': decimal_to_precision})
+
+# exchanges build a formatter per market and rebuild it when the precision changes
+exchange = Exchange()
+exchange.set_markets([{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'amount': 3, 'price': 2}}])
+assert(exchange.price_to_precision('BTC/USD', 123.456) == '123.46')
+assert(exchange.amount_to_precision('BTC/USD', 0.12345) == '0.123')
+assert(exchange.market_precision_formatter('BTC/USD', 'price', ROUND) is exchange.market_precision_formatter('BTC/USD', 'price', ROUND))
+exchange.markets['BTC/USD']['precision']['price'] = 0
+assert(exchange.price_to_precision('BTC/USD', 123.456) == '123')
+exchange.precisionMode = TICK_SIZE
+exchange.markets['BTC/USD']['precision']['price'] = 0.5
+assert(exchange.price_to_precision('BTC/USD', 123.8) == '124')
+exchange.markets['BTC/USD']['precision']['price'] = 10
+assert(exchange.price_to_precision('BTC/USD', 123.8) == '120')
+exchange.markets['BTC/USD']['precision']['price'] = 10.0
+assert(exchange.price_to_precision('BTC/USD', 123.8) == '120')
+
+# lists of values are formatted by the formatter of their market
+exchange = Exchange({'id': 'test'})
+exchange.set_markets([
+    {'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'amount': 3, 'price': 1}},
+    {'id': 'ethusd', 'symbol': 'ETH/USD', 'base': 'ETH', 'quote': 'USD', 'precision': {'amount': 2, 'price': 2}},
+])
+assert(exchange.prices_to_precision('BTC/USD', [100.06, 100.04]) == ['100.1', '100'])
+assert(exchange.prices_to_precision('BTC/USD', (100.06, 100.04), True) == [100.1, 100.0])
+assert(exchange.amounts_to_precision(['BTC/USD', 'ETH/USD', 'BTC/USD'], [0.1239, 0.1239, 1]) == ['0.123', '0.12', '1'])
+try:
+    exchange.amounts_to_precision(['BTC/USD'], [1, 2])
+    assert(False)
+except ExchangeError:
+    pass
+
+
+# and by the methods of the exchanges that override them
+class truncating(Exchange):
+
+    def price_to_precision(self, symbol, price):
+        return self.decimal_to_precision(price, TRUNCATE, self.markets[symbol]['precision']['price'])
+
+
+exchange = truncating()
+exchange.set_markets([{'id': 'btcusd', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD', 'precision': {'amount': 3, 'price': 1}}])
+assert(exchange.prices_to_precision(['BTC/USD'], [100.06]) == ['100'])
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import hmac
+import os
+import sys
+import threading
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+parsed = []
+
+
+def parse(secret):
+    def parser():
+        parsed.append(secret)
+        return [secret]
+    return parser
+
+
+limit = Exchange.signing_keys_limit
+Exchange.signing_keys.clear()
+try:
+    # a hit returns the key parsed by the first call
+    key = Exchange.signing_key('test', 'a', None, parse('a'))
+    assert(Exchange.signing_key('test', 'a', None, parse('a')) is key)
+    assert(parsed == ['a'])
+
+    # the least recently used key is evicted at the limit
+    Exchange.signing_keys_limit = 3
+    Exchange.signing_key('test', 'b', None, parse('b'))
+    Exchange.signing_key('test', 'c', None, parse('c'))
+    Exchange.signing_key('test', 'a', None, parse('a'))
+    Exchange.signing_key('test', 'd', None, parse('d'))
+    assert([secret for kind, secret, algorithm in Exchange.signing_keys] == ['c', 'a', 'd'])
+    Exchange.signing_key('test', 'b', None, parse('b'))
+    assert(parsed == ['a', 'b', 'c', 'd', 'b'])
+
+    # unhashable secrets and a limit of 0 bypass the cache
+    del parsed[:]
+    Exchange.signing_key('test', ['e'], None, parse('e'))
+    Exchange.signing_key('test', ['e'], None, parse('e'))
+    Exchange.signing_keys_limit = 0
+    Exchange.signing_key('test', 'a', None, parse('a'))
+    assert(parsed == ['e', 'e', 'a'])
+    assert(len(Exchange.signing_keys) == 3)
+
+    # the cached hmac is copied, concurrent signatures do not share its state
+    Exchange.signing_keys_limit = limit
+    secret = b'secret'
+    messages = [('message' + str(i)).encode() for i in range(100)]
+    expected = [hmac.new(secret, message, hashlib.sha256).hexdigest() for message in messages]
+    results = [[] for i in range(4)]
+
+    def sign(result):
+        for message in messages:
+            result.append(Exchange.hmac(message, secret))
+
+    threads = [threading.Thread(target=sign, args=(result,)) for result in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert(all(result == expected for result in results))
+    assert(Exchange.signing_keys[('hmac', secret, hashlib.sha256)].hexdigest() == hmac.new(secret, None, hashlib.sha256).hexdigest())
+    assert(Exchange.hmac(b'message', bytearray(secret)) == Exchange.hmac(b'message', secret))
+finally:
+    Exchange.signing_keys_limit = limit
+    Exchange.signing_keys.clear()
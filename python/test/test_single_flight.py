@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class loader(Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(loader, self).describe(), {
+            'id': 'loader',
+            'has': {
+                'fetchTradingLimits': True,
+            },
+        })
+
+    def __init__(self, config={}):
+        self.calls = []
+        super(loader, self).__init__(config)
+
+    async def call(self, name, result):
+        self.calls.append(name)
+        await asyncio.sleep(0.01)
+        return result
+
+    async def fetch_markets(self, params={}):
+        return await self.call('markets', [{'id': 'BTCUSD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}])
+
+    async def fetch_fees(self):
+        return await self.call('fees', {'trading': {'maker': 0.001}})
+
+    async def fetch_accounts(self, params={}):
+        return await self.call('accounts', [{'id': params.get('type', 'main')}])
+
+    async def fetch_trading_limits(self, symbols=None, params={}):
+        return await self.call('limits', dict((symbol, {'limits': {'amount': {'min': 1}}}) for symbol in symbols))
+
+
+async def test_single_flight():
+    exchange = loader({'markets': {'BTC/USD': {'id': 'BTCUSD', 'symbol': 'BTC/USD', 'base': 'BTC', 'quote': 'USD'}}})
+
+    # concurrent callers share one fetch and all of them get its result
+    fees = await asyncio.gather(*[exchange.load_fees() for i in range(3)])
+    assert(exchange.calls == ['fees'])
+    assert(all(result['trading']['maker'] == 0.001 for result in fees))
+
+    accounts = await asyncio.gather(*[exchange.load_accounts() for i in range(3)])
+    assert(exchange.calls == ['fees', 'accounts'])
+    assert(all(result == [{'id': 'main'}] for result in accounts))
+
+    limits = await asyncio.gather(*[exchange.load_trading_limits(['BTC/USD']) for i in range(3)])
+    assert(exchange.calls == ['fees', 'accounts', 'limits'])
+    assert(all(result['BTC/USD']['limits']['amount']['min'] == 1 for result in limits))
+
+    # the calls with different params are not joined
+    await asyncio.gather(exchange.load_accounts(True), exchange.load_accounts(True, {'type': 'margin'}))
+    assert(exchange.calls[3:] == ['accounts', 'accounts'])
+    await asyncio.gather(exchange.load_markets(True), exchange.load_markets(True), exchange.load_markets(True, {'type': 'spot'}))
+    assert(exchange.calls[5:] == ['markets', 'markets'])
+    del exchange.calls[:]
+
+    # a cancelled caller does not cancel the fetch awaited by the others
+    first = exchange.asyncio_loop.create_task(exchange.load_fees(True))
+    second = exchange.asyncio_loop.create_task(exchange.load_fees(True))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert((await second)['trading']['maker'] == 0.001)
+    assert(first.cancelled())
+    assert(exchange.calls == ['fees'])
+    assert(exchange._in_flight == {})
+    await exchange.close()
+
+
+asyncio.get_event_loop().run_until_complete(test_single_flight())
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import os
+import sys
+import threading
+
+# ------------------------------------------------------------------------------
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(root)
+
+# ------------------------------------------------------------------------------
+
+from ccxt.async_support.base.throttle import throttle  # noqa: E402
+from ccxt.base import throttle as sync_throttle_module  # noqa: E402
+from ccxt.async_support.base.exchange import Exchange  # noqa: E402
+from ccxt.async_support import binance  # noqa: E402
+
+# ------------------------------------------------------------------------------
+
+
+class FakeClock(object):
+    """The loop of the async throttle with a virtual clock, its delays are skipped instead of slept"""
+
+    def __init__(self, loop):
+        self.loop = loop
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def create_future(self):
+        return self.loop.create_future()
+
+    def call_later(self, delay, callback):
+        def fire():
+            self.now += delay
+            callback()
+        return self.loop.call_soon(fire)
+
+
+def close_to(a, b):
+    return abs(a - b) < 1e-9
+
+
+async def test_throttle():
+    clock = FakeClock(asyncio.get_event_loop())
+    rate_limit = 50  # milliseconds
+    limiter = throttle({
+        'loop': clock,
+        'refillRate': 1.0 / rate_limit,
+        'capacity': 1.0,
+    })
+    released = []
+
+    async def request(i, cost=None):
+        await limiter(cost)
+        released.append((i, clock.time() * 1000))
+
+    await asyncio.gather(*[request(i) for i in range(5)])
+
+    # waiters are released in order and spaced by the rate limit
+    assert([i for i, _ in released] == list(range(5)))
+    # the virtual delays are exact up to the shortest sleep of one millisecond
+    for i, timestamp in released:
+        assert(rate_limit * i - 1e-6 < timestamp < rate_limit * i + 1 + 1e-6)
+
+    # a weighted call holds the bucket back proportionally to its cost
+    clock.now += rate_limit / 1000
+    released = []
+    start = clock.time() * 1000
+    await asyncio.gather(request('heavy', 3), request('light'))
+    assert([i for i, _ in released] == ['heavy', 'light'])
+    assert(rate_limit * 3 - 1 - 1e-6 < released[1][1] - start < rate_limit * 3 + 1 + 1e-6)
+
+    # a cancelled waiter does not consume tokens
+    clock.now += rate_limit / 1000
+    first = limiter()
+    cancelled = limiter()
+    last = limiter()
+    cancelled.cancel()
+    await first
+    released_first = clock.time()
+    await last
+    assert(rate_limit - 1e-6 < (clock.time() - released_first) * 1000 < rate_limit + 1 + 1e-6)
+
+
+class weighted(Exchange):
+
+    def describe(self):
+        return self.deep_extend(super(weighted, self).describe(), {
+            'id': 'weighted',
+            'rateLimit': 50,
+            'enableRateLimit': True,
+            'tokenBuckets': {
+                'sapi': {},
+            },
+            'api': {
+                'public': {
+                    'get': {
+                        'ping': 1,
+                        'allOrders': 3,
+                    },
+                    'post': [
+                        'order',
+                    ],
+                },
+                'sapi': {
+                    'get': [
+                        'margin/asset',
+                    ],
+                },
+            },
+        })
+
+    async def fetch(self, url, method='GET', headers=None, body=None):
+        return url
+
+    def sign(self, path, api='public', method='GET', params={}, headers=None, body=None):
+        return {'url': api + '/' + path, 'method': method, 'body': body, 'headers': headers}
+
+
+async def test_weighted_endpoints():
+    loop = asyncio.get_event_loop()
+    exchange = weighted()
+    assert(exchange.calculate_rate_limiter_cost('public', 'GET', 'allOrders', {}) == 3)
+    assert(exchange.calculate_rate_limiter_cost('public', 'POST', 'order', {}) is None)
+    assert(await exchange.publicGetAllOrders() == 'public/allOrders')
+    # sapi has a bucket of its own and is not held back by the heavy public call
+    finished = []
+
+    async def call(name, method):
+        await method()
+        finished.append(name)
+
+    start = loop.time()
+    await asyncio.gather(call('public', exchange.public_get_ping), call('sapi', exchange.sapiGetMarginAsset))
+    assert(finished == ['sapi', 'public'])
+    assert((loop.time() - start) * 1000 >= 50 * 2.5)
+
+
+def test_binance_weights():
+    exchange = binance()
+    assert(exchange.calculate_rate_limiter_cost('private', 'GET', 'allOrders', {}) == 5)
+    assert(exchange.calculate_rate_limiter_cost('private', 'GET', 'openOrders', {'symbol': 'BTCUSDT'}) == 1)
+    assert(exchange.calculate_rate_limiter_cost('private', 'GET', 'openOrders', {}) == 40)
+    assert(exchange.calculate_rate_limiter_cost('public', 'GET', 'depth', {'limit': 5}) == 1)
+    assert(exchange.calculate_rate_limiter_cost('public', 'GET', 'depth', {'limit': 5000}) == 50)
+    assert(exchange.calculate_rate_limiter_cost('wapi', 'GET', 'depositHistory', {}) is None)
+    assert(sorted(exchange.throttles.keys()) == ['fapiPrivate', 'sapi', 'wapi'])
+
+
+def test_sync_throttle():
+    # the clock stands still and the sleeps are recorded, the delays are the reservations of the callers
+    clock = [100.0]
+    delays = []
+    lock = threading.Lock()
+
+    def sleep(delay):
+        with lock:
+            delays.append(delay * 1000)
+
+    now, real_sleep = sync_throttle_module.now, sync_throttle_module.sleep
+    sync_throttle_module.now, sync_throttle_module.sleep = lambda: clock[0], sleep
+    try:
+        rate_limit = 20  # milliseconds
+        limiter = sync_throttle_module.throttle({
+            'refillRate': 1.0 / rate_limit,
+            'capacity': 1.0,
+        })
+
+        def worker():
+            for i in range(2):
+                limiter()
+
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # eight requests from four threads never exceed the shared rate limit, the first one does not wait
+        assert(all(close_to(a, b) for a, b in zip(sorted(delays), [rate_limit * i for i in range(1, 8)])))
+        assert(len(delays) == 7)
+
+        # the capacity allows for bursts after an idle period
+        limiter = sync_throttle_module.throttle({
+            'refillRate': 1.0 / rate_limit,
+            'capacity': 3.0,
+        })
+        clock[0] += rate_limit * 4 / 1000
+        del delays[:]
+        for i in range(3):
+            limiter()
+        assert(delays == [])
+        # the weighted call drains the bucket, the next one waits for its refill
+        limiter(2)
+        limiter()
+        assert(len(delays) == 1 and close_to(delays[0], rate_limit * 2))
+    finally:
+        sync_throttle_module.now, sync_throttle_module.sleep = now, real_sleep
+
+
+test_binance_weights()
+test_sync_throttle()
+asyncio.get_event_loop().run_until_complete(test_throttle())
+asyncio.get_event_loop().run_until_complete(test_weighted_endpoints())